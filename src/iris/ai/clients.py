@@ -1,9 +1,21 @@
 import os
-import boto3
-from .config import BEDROCK_REGION, BOTO_CONFIG
+from .config import BEDROCK_REGION, boto_config
+
+# Created once per container so warm invocations reuse the client and its connections.
+# boto3 is imported on first use so importing this module doesn't load the SDK.
+_bedrock = None
+_dynamodb = None
 
 def bedrock_client():
-    return boto3.client("bedrock-runtime", region_name=BEDROCK_REGION, config=BOTO_CONFIG)
+    global _bedrock
+    if _bedrock is None:
+        import boto3
+        _bedrock = boto3.client("bedrock-runtime", region_name=BEDROCK_REGION, config=boto_config())
+    return _bedrock
 
 def dynamodb_resource():
-    return boto3.resource("dynamodb", region_name=os.environ.get("AWS_REGION", BEDROCK_REGION))
+    global _dynamodb
+    if _dynamodb is None:
+        import boto3
+        _dynamodb = boto3.resource("dynamodb", region_name=os.environ.get("AWS_REGION", BEDROCK_REGION))
+    return _dynamodb
@@ -1,5 +1,4 @@
 import os
-from botocore.config import Config
 
 MODEL_ID = os.environ.get("MODEL_ID", "amazon.nova-lite-v1:0")
 BEDROCK_REGION = os.environ.get("BEDROCK_REGION", os.environ.get("AWS_REGION", "us-east-1"))
@@ -16,8 +15,12 @@ INFERENCE_CONFIG = {
     "maxTokens": 900
 }
 
-BOTO_CONFIG = Config(
-    connect_timeout=5,
-    read_timeout=25,
-    retries={"max_attempts": 2, "mode": "standard"},
-)
+def boto_config():
+    # Imported here so loading this module doesn't pull in botocore.
+    from botocore.config import Config
+
+    return Config(
+        connect_timeout=5,
+        read_timeout=25,
+        retries={"max_attempts": 2, "mode": "standard"},
+    )
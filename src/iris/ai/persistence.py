@@ -3,8 +3,6 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from botocore.exceptions import ClientError
-
 from .config import PK_NAME, SK_NAME, STATE_VALUE
 from ..infra.serialization import ddb_clean, ddb_sanitize
 
@@ -16,6 +14,8 @@ def ddb_key(thread_id: str) -> Dict[str, Any]:
 
 
 def ddb_get_case(table, thread_id: str) -> Optional[Dict[str, Any]]:
+    from botocore.exceptions import ClientError
+
     try:
         resp = table.get_item(Key=ddb_key(thread_id), ConsistentRead=True)
         return resp.get("Item")
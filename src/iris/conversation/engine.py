@@ -1,20 +1,19 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 from typing import Any, Dict, Optional, Tuple
 import re
 
 from ..infra import ddb as ddb_mod
 from ..infra.config import DDB_SK_VALUE, DEFAULT_DURATION_MINUTES
-from ..infra.serialization import ddb_clean, ddb_sanitize, to_json_safe
+from ..infra.serialization import ddb_clean, ddb_sanitize, to_json_safe, json_dumps_compact
 
 from .context import IrisContext, ConversationState, Intent
 from ..coordination.availability_parser import parse_availability
 from ..coordination.constraint_parser import parse_constraints
 from ..coordination.models import TimeWindow
+from ..coordination.normalization import get_zoneinfo
 from .parsing import infer_intent
 from .rules import missing_fields, is_ready
 from .formatting import ask_for_missing, confirm_summary
@@ -152,27 +151,30 @@ def _extract_time_minutes(text: str) -> Optional[int]:
     return hour * 60 + minute
 
 
-def _relative_weekday_name(text: str, tz_name: str) -> Optional[str]:
-    m = _RELATIVE_DAY_RE.search(text or "")
-    if not m:
-        return None
-    token = m.group(1).lower()
-    now_local = datetime.now(tz=ZoneInfo(tz_name))
-    if token == "tomorrow":
+def _weekday_name_for_relative(token: str, tz_name: str) -> str:
+    now_local = datetime.now(tz=get_zoneinfo(tz_name))
+    if token.lower() == "tomorrow":
         day = (now_local + timedelta(days=1)).date()
     else:
         day = now_local.date()
     return day.strftime("%A")
 
 
+def _relative_weekday_name(text: str, tz_name: str) -> Optional[str]:
+    m = _RELATIVE_DAY_RE.search(text or "")
+    if not m:
+        return None
+    return _weekday_name_for_relative(m.group(1), tz_name)
+
+
 def _normalize_relative_candidate(candidate: Dict[str, Any], tz_name: str) -> Dict[str, Any]:
     start_local = (candidate.get("start_local") or "").strip()
     end_local = (candidate.get("end_local") or "").strip()
-    if not (_RELATIVE_DAY_RE.search(start_local) or _RELATIVE_DAY_RE.search(end_local)):
-        return candidate
-    weekday = _relative_weekday_name(start_local or end_local, tz_name)
-    if not weekday:
+    # One scan both gates normalization and yields the token to resolve.
+    m = _RELATIVE_DAY_RE.search(start_local or end_local)
+    if not m:
         return candidate
+    weekday = _weekday_name_for_relative(m.group(1), tz_name)
     def _replace(text: str) -> str:
         return _RELATIVE_DAY_RE.sub(weekday, text)
     normalized = dict(candidate)
@@ -338,7 +340,7 @@ def process_incoming_email(
                             "timezone": tz,
                             "last_message_id": message_id,
                             "last_candidate": last_candidate or {},
-                            "last_ai_json": json.dumps(to_json_safe(ai_parsed)) if ai_parsed else "{}",
+                            "last_ai_json": json_dumps_compact(to_json_safe(ai_parsed)) if ai_parsed else "{}",
                         }
                     )
                     table.put_item(Item=ddb_clean(ddb_sanitize(thread_item)))
@@ -387,7 +389,7 @@ def process_incoming_email(
             "timezone": tz,
             "last_message_id": message_id,
             "last_candidate": last_candidate or {},
-            "last_ai_json": json.dumps(to_json_safe(ai_parsed)) if ai_parsed else "{}",
+            "last_ai_json": json_dumps_compact(to_json_safe(ai_parsed)) if ai_parsed else "{}",
         }
     )
     table.put_item(Item=ddb_clean(ddb_sanitize(thread_item)))
@@ -4,10 +4,10 @@ from __future__ import annotations
 import os
 from typing import Tuple, Optional
 
-import boto3
-
 
 def _bedrock_runtime_client():
+    import boto3
+
     region = os.getenv("BEDROCK_REGION") or os.getenv("AWS_REGION") or "us-east-1"
     return boto3.client("bedrock-runtime", region_name=region)
 
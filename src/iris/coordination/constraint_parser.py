@@ -2,30 +2,36 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 from typing import List, Optional, Tuple
-from zoneinfo import ZoneInfo
 
 from .models import TimeWindow
-from .normalization import DAY_ALIASES, normalize_dash, split_time_range
+from .normalization import DAY_ALIASES, DAY_DELTAS, get_zoneinfo, normalize_dash, split_time_range
 
 DOW = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
+# Weekday names are unique on their first two letters ("tues"/"thurs" included).
+_DOW2 = {"mo": 0, "tu": 1, "we": 2, "th": 3, "fr": 4, "sa": 5, "su": 6}
 DOW_RE = r"(mon(?:day)?|tue(?:s|sday)?|wed(?:nesday)?|thu(?:r|rs|rsday)?|fri(?:day)?|sat(?:urday)?|sun(?:day)?)"
 RANGE_DOW_RE = re.compile(rf"\b{DOW_RE}\s*-\s*{DOW_RE}\b", re.IGNORECASE)
 LIST_DOW_RE = re.compile(rf"\b{DOW_RE}(?:\s*/\s*{DOW_RE})+\b", re.IGNORECASE)
+LIST_DOW_SPLIT_RE = re.compile(r"\s*/\s*")
+TODAY_RE = re.compile(r"\btoday\b")
+MORNING_RE = re.compile(r"\bmorning\b", re.IGNORECASE)
+AFTERNOON_RE = re.compile(r"\bafternoon\b", re.IGNORECASE)
+EVENING_RE = re.compile(r"\bevening\b", re.IGNORECASE)
 
 LINE_DAY_RE = re.compile(r"^\s*(?P<day>[A-Za-z]{3,9})\b\s*[:,-]?\s*(?P<times>.+?)\s*$")
 TIME_TOKEN_RE = re.compile(r"^\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*$", re.IGNORECASE)
 
 def _now_date(tz: str) -> date:
-    return datetime.now(tz=ZoneInfo(tz)).date()
+    return datetime.now(tz=get_zoneinfo(tz)).date()
 
 def _start_of_next_week(d: date) -> date:
     # next Monday (not "this Monday")
     days_until_mon = (7 - d.weekday()) % 7
     if days_until_mon == 0:
         days_until_mon = 7
-    return d + timedelta(days=days_until_mon)
+    return d + DAY_DELTAS[days_until_mon]
 
 def _minutes(h: int, m: int = 0) -> int:
     return h * 60 + m
@@ -91,8 +97,8 @@ def _extract_days(text: str, tz: str) -> Optional[List[date]]:
     today = _now_date(tz)
 
     if "tomorrow" in t:
-        return [today + timedelta(days=1)]
-    if re.search(r"\btoday\b", t):
+        return [today + DAY_DELTAS[1]]
+    if "today" in t and TODAY_RE.search(t):
         return [today]
 
     base = today
@@ -103,16 +109,14 @@ def _extract_days(text: str, tz: str) -> Optional[List[date]]:
     m = RANGE_DOW_RE.search(t)
     if m:
         a, b = m.group(0).split("-")
-        a = a.strip()[:3].lower().replace("tues", "tue")
-        b = b.strip()[:3].lower().replace("tues", "tue")
-        if a not in DOW or b not in DOW:
+        start = _DOW2.get(a.strip()[:2].lower())
+        end = _DOW2.get(b.strip()[:2].lower())
+        if start is None or end is None:
             return None
-        start = DOW[a]
-        end = DOW[b]
         # build list within that week (base week)
         days = []
         for i in range(7):
-            d = base + timedelta(days=i)
+            d = base + DAY_DELTAS[i]
             if start <= end:
                 if start <= d.weekday() <= end:
                     days.append(d)
@@ -125,15 +129,15 @@ def _extract_days(text: str, tz: str) -> Optional[List[date]]:
     # List like Tue/Thu
     m = LIST_DOW_RE.search(t)
     if m:
-        parts = re.split(r"\s*/\s*", m.group(0))
+        parts = LIST_DOW_SPLIT_RE.split(m.group(0))
         wanted = set()
         for p in parts:
-            key = p.strip()[:3].lower().replace("tues", "tue")
-            if key in DOW:
-                wanted.add(DOW[key])
+            wd = _DOW2.get(p.strip()[:2].lower())
+            if wd is not None:
+                wanted.add(wd)
         if not wanted:
             return None
-        days = [base + timedelta(days=i) for i in range(7) if (base + timedelta(days=i)).weekday() in wanted]
+        days = [d for d in (base + DAY_DELTAS[i] for i in range(7)) if d.weekday() in wanted]
         return days
 
     # Single/multiple day mentions (collect all)
@@ -144,7 +148,7 @@ def _extract_days(text: str, tz: str) -> Optional[List[date]]:
             if idx is None:
                 continue
             for i in range(7):
-                d = base + timedelta(days=i)
+                d = base + DAY_DELTAS[i]
                 if d.weekday() == idx and d not in found:
                     found.append(d)
                     break
@@ -189,7 +193,7 @@ def _to_minutes(h: int, m: int, ap: str) -> int:
 
 def _date_for_weekday(base: date, idx: int) -> Optional[date]:
     for i in range(7):
-        d = base + timedelta(days=i)
+        d = base + DAY_DELTAS[i]
         if d.weekday() == idx:
             return d
     return None
@@ -281,9 +285,9 @@ def parse_constraints(text: str, tz: str) -> Tuple[List[TimeWindow], Optional[st
 
     # part of day
     part = None
-    if re.search(r"\bmorning\b", t, re.IGNORECASE): part = "morning"
-    if re.search(r"\bafternoon\b", t, re.IGNORECASE): part = "afternoon"
-    if re.search(r"\bevening\b", t, re.IGNORECASE): part = "evening"
+    if MORNING_RE.search(t): part = "morning"
+    if AFTERNOON_RE.search(t): part = "afternoon"
+    if EVENING_RE.search(t): part = "evening"
 
     start_min, end_min = _time_window_for_part_of_day(part or "anytime")
 
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta
 from typing import List, Optional
-from zoneinfo import ZoneInfo
 
 from .availability_parser import parse_availability
 from .models import MeetingThread, Participant, ThreadStatus, TimeWindow
+from .normalization import DAY_DELTAS, get_zoneinfo
 from .reconciler import find_earliest_overlap
 from .templates import (
     availability_request_email,
@@ -18,6 +18,11 @@ from .templates import (
 from .constraint_parser import parse_constraints
 from ..ai.text_normalize import clean_email_text
 
+_FULL_DAY = 24 * 60
+_MIN_PARSE_CHARS = 3
+_MAX_PARSE_CHARS = 4096
+
+
 @dataclass(frozen=True)
 class OutboundMessage:
     to: List[str]
@@ -61,27 +66,25 @@ class IrisCoordinator:
         )
 
     def _full_availability_windows(self, tz_name: str, days: int = 14) -> List[TimeWindow]:
-        tz = ZoneInfo(tz_name or "UTC")
+        tz = get_zoneinfo(tz_name or "UTC")
         today = datetime.now(tz=tz).date()
-        windows: List[TimeWindow] = []
-        for i in range(days):
-            d = date(today.year, today.month, today.day) + timedelta(days=i)
-            windows.append(TimeWindow(day=d, start_minute=0, end_minute=24 * 60))
-        return windows
+        deltas = DAY_DELTAS[:days] if days <= len(DAY_DELTAS) else [timedelta(days=i) for i in range(days)]
+        return [TimeWindow(day=today + delta, start_minute=0, end_minute=_FULL_DAY) for delta in deltas]
 
     def start_thread(self, thread: MeetingThread) -> OutboundMessage:
         """
         Send initial availability request to all participants.
         """
+        now = datetime.utcnow()
         if thread.deadline_at is None:
-            thread.deadline_at = datetime.utcnow() + timedelta(hours=self.default_deadline_hours)
+            thread.deadline_at = now + timedelta(hours=self.default_deadline_hours)
 
-        thread.availability_requests_sent_at = datetime.utcnow()
+        thread.availability_requests_sent_at = now
         thread.status = ThreadStatus.WAITING
         thread.reminder_status = "COLLECTING_AVAILABILITY"
         for p in thread.participants.values():
             p.status = "PENDING"
-            p.requested_at = thread.availability_requests_sent_at
+            p.requested_at = now
             p.last_reminded_at = None
 
         body = availability_request_email(
@@ -91,7 +94,7 @@ class IrisCoordinator:
         )
         return OutboundMessage(
             to=list(thread.participants.keys()),
-            subject=f"{thread.subject} — availability",
+            subject=thread.subjects.availability,
             body=body,
         )
 
@@ -109,13 +112,25 @@ class IrisCoordinator:
         p.responded_at = datetime.utcnow()
         p.status = "RESPONDED"
 
-        result = parse_availability(body_text, tz_name=thread.timezone)
+        if len(body_text) < _MIN_PARSE_CHARS:
+            # Nothing a parser could match; record the (empty) response without scanning.
+            p.parsed_windows = []
+            p.has_responded = True
+            p.needs_clarification = False
+            p.clarification_question = None
+            self._update_thread_status(thread)
+            return []
+
+        # Long quoted threads add regex work without adding availability.
+        parse_text = body_text[:_MAX_PARSE_CHARS]
+
+        result = parse_availability(parse_text, tz_name=thread.timezone)
         p.parsed_windows = result.windows
         p.has_responded = True
 
         # If they didn't follow the structured format, try natural-language constraints
         if not p.parsed_windows and not result.needs_clarification:
-            windows, clar_q = parse_constraints(body_text, tz=thread.timezone)
+            windows, clar_q = parse_constraints(parse_text, tz=thread.timezone)
             if windows:
                 p.parsed_windows = windows
             elif clar_q:
@@ -124,10 +139,10 @@ class IrisCoordinator:
                 thread.status = ThreadStatus.NEEDS_CLARIFICATION
                 return [OutboundMessage(
                     to=[participant_email],
-                    subject=f"{thread.subject} — quick clarification",
+                    subject=thread.subjects.clarification,
                     body=clarification_email(clar_q),
                 )]
-            elif self._accept_all_response(body_text):
+            elif self._accept_all_response(parse_text):
                 # Treat "these times work for me" as full flexibility.
                 p.parsed_windows = self._full_availability_windows(thread.timezone)
 
@@ -138,7 +153,7 @@ class IrisCoordinator:
             return [
                 OutboundMessage(
                     to=[participant_email],
-                    subject=f"{thread.subject} — quick clarification",
+                    subject=thread.subjects.clarification,
                     body=clarification_email(result.clarification_question or "Could you clarify?"),
                 )
             ]
@@ -146,16 +161,27 @@ class IrisCoordinator:
         p.needs_clarification = False
         p.clarification_question = None
 
-        # Update thread status
-        if thread.any_needs_clarification():
+        self._update_thread_status(thread)
+        return []
+
+    def _update_thread_status(self, thread: MeetingThread) -> None:
+        # Single pass over participants
+        all_responded = True
+        any_clar = False
+        for other in thread.participants.values():
+            if not other.has_responded:
+                all_responded = False
+            if other.needs_clarification:
+                any_clar = True
+                break
+
+        if any_clar:
             thread.status = ThreadStatus.NEEDS_CLARIFICATION
-        elif thread.all_responded():
+        elif all_responded:
             thread.status = ThreadStatus.READY_TO_SCHEDULE
         else:
             thread.status = ThreadStatus.WAITING
 
-        return []
-
     def try_schedule(self, thread: MeetingThread) -> tuple[Optional[SchedulePlan], List[OutboundMessage]]:
         """
         Only schedules when ALL participants responded and no clarifications are pending.
@@ -164,19 +190,32 @@ class IrisCoordinator:
         if thread.status == ThreadStatus.SCHEDULED:
             return None, []
 
-        if not thread.all_responded():
+        # Single pass over participants instead of one scan per check.
+        all_responded = True
+        any_clar = False
+        any_missing_windows = False
+        for p in thread.participants.values():
+            if not p.has_responded:
+                all_responded = False
+                break
+            if p.needs_clarification:
+                any_clar = True
+            if not p.parsed_windows:
+                any_missing_windows = True
+
+        if not all_responded:
             return None, []
 
-        if thread.any_needs_clarification():
+        if any_clar:
             thread.status = ThreadStatus.NEEDS_CLARIFICATION
             return None, []
 
-        if any(not p.parsed_windows for p in thread.participants.values()):
+        if any_missing_windows:
             thread.status = ThreadStatus.WAITING
             return None, [
                 OutboundMessage(
                     to=list(thread.participants.keys()),
-                    subject=f"{thread.subject} — need more availability",
+                    subject=thread.subjects.need_more_availability,
                     body=no_overlap_email(),
                 )
             ]
@@ -194,7 +233,7 @@ class IrisCoordinator:
             return None, [
                 OutboundMessage(
                     to=list(thread.participants.keys()),
-                    subject=f"{thread.subject} — need more availability",
+                    subject=thread.subjects.need_more_availability,
                     body=no_overlap_email(),
                 )
             ]
@@ -213,7 +252,7 @@ class IrisCoordinator:
             [
                 OutboundMessage(
                     to=list(thread.participants.keys()),
-                    subject=f"{thread.subject} — scheduled",
+                    subject=thread.subjects.scheduled,
                     body=scheduled_email(start_str, end_str, thread.timezone, slot.rationale),
                 )
             ],
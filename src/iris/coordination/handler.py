@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 import re
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
@@ -11,17 +11,35 @@ from .coordinator import IrisCoordinator
 from .types import OutboundMessage, SchedulePlan
 
 from .duration_parser import parse_duration_minutes
-from .normalization import DAY_ALIASES
+from .normalization import DAY_ALIASES, DAY_DELTAS, get_zoneinfo
 from .templates import clarification_email
 from ..scheduling.scheduling import candidate_to_datetimes
 
 _DAY_ORDER = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+_DAY_INDEX: Dict[str, int] = {d: i for i, d in enumerate(_DAY_ORDER)}
 
 _WEEKDAY_RE = re.compile(
     r"\b(mon(?:day)?|tue(?:sday)?|wed(?:nesday)?|thu(?:rsday)?|fri(?:day)?|sat(?:urday)?|sun(?:day)?)\b",
     re.IGNORECASE,
 )
+_SOURCE_TEXT_LIMIT = 200
+_DEFAULT_CLAR_Q = "Could you clarify the exact time (including AM/PM and timezone)?"
+
+# 24h hour -> (12h hour, meridiem)
+_H12 = [(12, "AM")] + [(h, "AM") for h in range(1, 12)] + [(12, "PM")] + [(h, "PM") for h in range(1, 12)]
 _TIME_RE = re.compile(r"\b(\d{1,2})(?::(\d{2}))?\s*(am|pm)\b", re.IGNORECASE)
+# Case-insensitive am/pm presence check without a lowercased copy of the body.
+_MERIDIEM_RE = re.compile(r"[ap]m", re.IGNORECASE)
+# Longest aliases first so "thurs" wins over "thu" inside the alternation.
+_DAY_TOKEN_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, sorted(DAY_ALIASES, key=len, reverse=True))) + r")\b",
+    re.IGNORECASE,
+)
+# Day token followed closely by a clock time ("tue at 3pm"); bounded gap keeps backtracking cheap.
+_DAY_TIME_RE = re.compile(
+    _DAY_TOKEN_RE.pattern + r"[^\n]{0,40}?\b(\d{1,2})(?::(\d{2}))?\s*(am|pm)\b",
+    re.IGNORECASE,
+)
 
 _WEEKDAY_CANON = {
     "mon": "Monday",
@@ -58,31 +76,13 @@ def _extract_time_minutes(text: str) -> Optional[int]:
     m = _TIME_RE.search(text or "")
     if not m:
         return None
-    hour = int(m.group(1))
-    minute = int(m.group(2) or "0")
-    ampm = m.group(3).lower()
-    if ampm == "am":
-        if hour == 12:
-            hour = 0
-    elif ampm == "pm":
-        if hour != 12:
-            hour += 12
-    return hour * 60 + minute
+    hour = int(m.group(1)) % 12 + (12 if m.group(3).lower() == "pm" else 0)
+    return hour * 60 + int(m.group(2) or "0")
 
 
 def _format_time_12h(minutes: int) -> str:
-    h = minutes // 60
-    m = minutes % 60
-    ampm = "AM"
-    if h == 0:
-        h = 12
-        ampm = "AM"
-    elif h == 12:
-        ampm = "PM"
-    elif h > 12:
-        h -= 12
-        ampm = "PM"
-    return f"{h}:{m:02d} {ampm}"
+    h, ampm = _H12[(minutes // 60) % 24]
+    return f"{h}:{minutes % 60:02d} {ampm}"
 
 
 def _candidate_from_time_only(
@@ -99,49 +99,93 @@ def _candidate_from_time_only(
         "start_local": start_local,
         "end_local": end_local,
         "confidence": 0.9,
-        "source_text": source_text[:200],
+        "source_text": source_text if len(source_text) <= _SOURCE_TEXT_LIMIT else source_text[:_SOURCE_TEXT_LIMIT],
     }
 
-def _parse_explicit_day_time(text: str, tz_name: str) -> Optional[datetime]:
-    if not text:
+def _try_derive_from_pending(
+    thread: MeetingThread, body_text: str, tz: ZoneInfo
+) -> Optional[Tuple[datetime, datetime]]:
+    """Combine the weekday of thread.pending_candidate with a time-only reply."""
+    pending_weekday = _weekday_from_candidate(thread.pending_candidate)
+    if not pending_weekday:
         return None
+    time_minutes = _extract_time_minutes(body_text)
+    if time_minutes is None:
+        return None
+    derived = _candidate_from_time_only(
+        time_minutes=time_minutes,
+        weekday=pending_weekday,
+        duration_minutes=thread.duration_minutes or thread.meeting_duration_minutes,
+        source_text=body_text,
+    )
+    try:
+        start_dt, end_dt = candidate_to_datetimes(derived, tz)
+    except Exception:
+        return None
+    if not start_dt or not end_dt:
+        return None
+    return start_dt, end_dt
+
+
+def _extract_day_time(text: str) -> Optional[Tuple[int, int, int]]:
+    """
+    (weekday index, 24h hour, minute) named in text, independent of the clock.
 
-    day_match = None
-    time_match = None
+    The first day token with an am/pm time after it on the same line (within 40
+    characters) wins, together with that time. So "10:30am next week thu 12pm" is
+    Thu 12:00, and a day too far from any time is passed over for a later one that
+    has a time right after it. Without such a pair, the first day token goes with
+    the first time anywhere in the text ("3pm on friday" is Fri 15:00).
+    """
+    # Both time patterns require an am/pm marker; skip the regex work when there is none.
+    if not _MERIDIEM_RE.search(text):
+        return None
 
-    for m in re.finditer(r"\b([A-Za-z]{3,9})\b", text):
-        token = m.group(1).lower()
-        canon = DAY_ALIASES.get(token)
-        if canon in _DAY_ORDER:
-            day_match = canon
-            break
+    day = _DAY_TOKEN_RE.search(text)
+    if day is None:
+        return None
 
-    m = re.search(r"\b(\d{1,2})(?::(\d{2}))?\s*(am|pm)\b", text, re.IGNORECASE)
+    # A paired match can't start before the first day token, so search from there.
+    m = _DAY_TIME_RE.search(text, day.start())
     if m:
+        day_match = DAY_ALIASES.get(m.group(1).lower())
+        time_match = (int(m.group(2)), int(m.group(3) or "0"), m.group(4).lower())
+    else:
+        m = _TIME_RE.search(text)
+        if m is None:
+            return None
+        day_match = DAY_ALIASES.get(day.group(1).lower())
         time_match = (int(m.group(1)), int(m.group(2) or "0"), m.group(3).lower())
 
-    if not day_match or not time_match:
+    if not day_match:
         return None
 
-    target_wd = _DAY_ORDER.index(day_match)
-    tz = ZoneInfo(tz_name)
-    now_local = datetime.now(tz=tz)
-    days_ahead = (target_wd - now_local.weekday()) % 7
-    base = now_local + timedelta(days=days_ahead)
-
     hour, minute, ap = time_match
-    if ap == "am" and hour == 12:
-        hour = 0
-    if ap == "pm" and hour != 12:
-        hour += 12
+    return _DAY_INDEX[day_match], hour % 12 + (12 if ap == "pm" else 0), minute
+
+
+def _parse_explicit_day_time(
+    text: str, tz_name: str, now_local: Optional[datetime] = None
+) -> Optional[datetime]:
+    if not text:
+        return None
+
+    day_time = _extract_day_time(text)
+    if day_time is None:
+        return None
 
-    start_dt = datetime(base.year, base.month, base.day, hour, minute, tzinfo=tz)
+    target_wd, hour, minute = day_time
+    if now_local is None:
+        now_local = datetime.now(tz=get_zoneinfo(tz_name))
+    days_ahead = (target_wd - now_local.weekday()) % 7
+
+    start_dt = now_local.replace(hour=hour, minute=minute, second=0, microsecond=0) + DAY_DELTAS[days_ahead]
     if start_dt <= now_local and days_ahead == 0:
         start_dt = start_dt + timedelta(days=7)
     return start_dt
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InboundEmail:
     thread_id: str
     from_email: str
@@ -153,31 +197,30 @@ class InboundEmail:
     ai_parsed: Optional[Dict[str, Any]] = None
 
 
-def _ai_intent(ai_parsed: Optional[Dict[str, Any]]) -> Optional[str]:
-    if not isinstance(ai_parsed, dict):
-        return None
-    intent = ai_parsed.get("intent")
-    return intent if isinstance(intent, str) else None
-
-
-def _ai_needs_clarification(ai_parsed: Optional[Dict[str, Any]]) -> bool:
-    if not isinstance(ai_parsed, dict):
-        return False
-    return bool(ai_parsed.get("needs_clarification") is True)
+class _AI(NamedTuple):
+    intent: Optional[str]
+    needs: bool
+    cands: List[Dict[str, Any]]
+    clar_q: Optional[str]
 
 
-def _ai_clarifying_question(ai_parsed: Optional[Dict[str, Any]]) -> Optional[str]:
-    if not isinstance(ai_parsed, dict):
-        return None
-    q = ai_parsed.get("clarifying_question")
-    return q if isinstance(q, str) and q.strip() else None
+_NO_AI = _AI(None, False, [], None)
 
 
-def _ai_candidates(ai_parsed: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _parse_ai(ai_parsed: Optional[Dict[str, Any]]) -> _AI:
+    """Validate the AI parse once and pull out everything handle() needs."""
     if not isinstance(ai_parsed, dict):
-        return []
-    cands = ai_parsed.get("candidates")
-    return cands if isinstance(cands, list) else []
+        return _NO_AI
+    get = ai_parsed.get
+    intent = get("intent")
+    q = get("clarifying_question")
+    cands = get("candidates")
+    return _AI(
+        intent=intent if isinstance(intent, str) else None,
+        needs=get("needs_clarification") is True,
+        cands=cands if isinstance(cands, list) else [],
+        clar_q=q if isinstance(q, str) and q.strip() else None,
+    )
 
 
 class IrisCoordinationHandler:
@@ -186,10 +229,39 @@ class IrisCoordinationHandler:
     NO AWS, NO SES, NO DynamoDB, NO entrypoints imports.
     """
 
-    def __init__(self, store):
-        # store must implement get(thread_id) and put(thread)
+    def __init__(self, store, auto_flush: bool = True):
+        # store must implement get(thread_id) and put(thread); batch_put(threads) is optional
         self.store = store
         self.coordinator = IrisCoordinator()
+        # With auto_flush=False, writes are buffered until flush() (replay/backfill).
+        self.auto_flush = auto_flush
+        self._dirty: Dict[str, MeetingThread] = {}
+
+    def get(self, thread_id: str) -> Optional[MeetingThread]:
+        # Buffered (unflushed) state wins over what the store still has.
+        return self._dirty.get(thread_id) or self.store.get(thread_id)
+
+    def save(self, thread: MeetingThread) -> None:
+        self._dirty[thread.thread_id] = thread
+        if self.auto_flush:
+            self.flush()
+
+    def drain(self) -> List[MeetingThread]:
+        """Hand buffered threads to the caller (e.g. to write alongside other items) without writing them."""
+        threads = list(self._dirty.values())
+        self._dirty.clear()
+        return threads
+
+    def flush(self) -> None:
+        if not self._dirty:
+            return
+        threads = self.drain()
+        batch_put = getattr(self.store, "batch_put", None)
+        if batch_put is not None:
+            batch_put(threads)
+        else:
+            for thread in threads:
+                self.store.put(thread)
 
     def handle(
         self, inbound: InboundEmail
@@ -198,7 +270,7 @@ class IrisCoordinationHandler:
         outbound: List[OutboundMessage] = []
         schedule_plan: Optional[SchedulePlan] = None
 
-        thread = self.store.get(inbound.thread_id)
+        thread = self.get(inbound.thread_id)
 
         # --- New coordination request ---
         if inbound.is_new_request:
@@ -212,31 +284,28 @@ class IrisCoordinationHandler:
                 if dur:
                     thread.duration_minutes = dur
 
-            ai_intent = _ai_intent(inbound.ai_parsed)
-            ai_needs = _ai_needs_clarification(inbound.ai_parsed)
-            ai_cands = _ai_candidates(inbound.ai_parsed)
-            ai_clar_q = _ai_clarifying_question(inbound.ai_parsed)
+            ai = _parse_ai(inbound.ai_parsed)
 
-            if ai_intent == "NEW_REQUEST":
-                if ai_needs and ai_cands:
-                    thread.pending_candidate = ai_cands[0] if isinstance(ai_cands[0], dict) else None
-                    clar_q = ai_clar_q or "Could you clarify the exact time (including AM/PM and timezone)?"
+            if ai.intent == "NEW_REQUEST":
+                if ai.needs and ai.cands:
+                    thread.pending_candidate = ai.cands[0] if isinstance(ai.cands[0], dict) else None
+                    clar_q = ai.clar_q or _DEFAULT_CLAR_Q
                     thread.status = ThreadStatus.NEEDS_CLARIFICATION
-                    self.store.put(thread)
+                    self.save(thread)
                     return [
                         OutboundMessage(
                             to=[thread.organizer_email],
-                            subject=f"{thread.subject} — quick clarification",
+                            subject=thread.subjects.clarification,
                             body=clarification_email(clar_q),
                         )
                     ], None
 
-                if not ai_needs and ai_cands:
-                    tz = ZoneInfo(thread.timezone)
+                if not ai.needs and ai.cands:
+                    tz = get_zoneinfo(thread.timezone)
                     start_dt = None
                     end_dt = None
                     try:
-                        start_dt, end_dt = candidate_to_datetimes(ai_cands[0], tz)
+                        start_dt, end_dt = candidate_to_datetimes(ai.cands[0], tz)
                     except Exception:
                         start_dt = None
 
@@ -247,11 +316,12 @@ class IrisCoordinationHandler:
                         thread.status = ThreadStatus.SCHEDULED
                         thread.reminder_status = "SCHEDULED"
                         thread.pending_candidate = None
-                        self.store.put(thread)
+                        self.save(thread)
                         return [], SchedulePlan(start=start_dt, end=end_dt, rationale=thread.scheduling_rationale)
 
             # If the request specifies an explicit day/time, schedule immediately.
-            start_dt = _parse_explicit_day_time(inbound.body_text, thread.timezone)
+            now_local = datetime.now(tz=get_zoneinfo(thread.timezone))
+            start_dt = _parse_explicit_day_time(inbound.body_text, thread.timezone, now_local)
             if start_dt:
                 duration = thread.duration_minutes or thread.meeting_duration_minutes
                 end_dt = start_dt + timedelta(minutes=duration)
@@ -260,13 +330,13 @@ class IrisCoordinationHandler:
                 thread.scheduling_rationale = "Explicit time requested by organizer."
                 thread.status = ThreadStatus.SCHEDULED
                 thread.reminder_status = "SCHEDULED"
-                self.store.put(thread)
+                self.save(thread)
                 return [], SchedulePlan(start=start_dt, end=end_dt, rationale=thread.scheduling_rationale)
 
             outbound.append(
                 self.coordinator.start_thread(thread)
             )
-            self.store.put(thread)
+            self.save(thread)
             return outbound, None
 
         # --- Existing thread reply ---
@@ -279,50 +349,37 @@ class IrisCoordinationHandler:
             and thread.status == ThreadStatus.NEEDS_CLARIFICATION
             and thread.availability_requests_sent_at is None
         ):
-            ai_intent = _ai_intent(inbound.ai_parsed)
-            ai_needs = _ai_needs_clarification(inbound.ai_parsed)
-            ai_cands = _ai_candidates(inbound.ai_parsed)
-            ai_clar_q = _ai_clarifying_question(inbound.ai_parsed)
-
-            if ai_intent in ("NEW_REQUEST", "CONFIRMATION"):
-                if ai_needs and ai_cands:
-                    thread.pending_candidate = ai_cands[0] if isinstance(ai_cands[0], dict) else thread.pending_candidate
-                    clar_q = ai_clar_q or "Could you clarify the exact time (including AM/PM and timezone)?"
-                    self.store.put(thread)
+            ai = _parse_ai(inbound.ai_parsed)
+            pending_tried = False
+
+            if ai.intent in ("NEW_REQUEST", "CONFIRMATION"):
+                if ai.needs and ai.cands:
+                    thread.pending_candidate = ai.cands[0] if isinstance(ai.cands[0], dict) else thread.pending_candidate
+                    clar_q = ai.clar_q or _DEFAULT_CLAR_Q
+                    self.save(thread)
                     return [
                         OutboundMessage(
                             to=[thread.organizer_email],
-                            subject=f"{thread.subject} — quick clarification",
+                            subject=thread.subjects.clarification,
                             body=clarification_email(clar_q),
                         )
                     ], None
 
-                if not ai_needs and ai_cands:
-                    tz = ZoneInfo(thread.timezone)
+                if not ai.needs and ai.cands:
+                    tz = get_zoneinfo(thread.timezone)
                     start_dt = None
                     end_dt = None
                     try:
-                        start_dt, end_dt = candidate_to_datetimes(ai_cands[0], tz)
+                        start_dt, end_dt = candidate_to_datetimes(ai.cands[0], tz)
                     except Exception:
                         start_dt = None
                         end_dt = None
 
                     if (not start_dt or not end_dt) and thread.pending_candidate:
-                        pending_weekday = _weekday_from_candidate(thread.pending_candidate)
-                        time_minutes = _extract_time_minutes(inbound.body_text)
-                        if pending_weekday and time_minutes is not None:
-                            duration = thread.duration_minutes or thread.meeting_duration_minutes
-                            derived = _candidate_from_time_only(
-                                time_minutes=time_minutes,
-                                weekday=pending_weekday,
-                                duration_minutes=duration,
-                                source_text=inbound.body_text,
-                            )
-                            try:
-                                start_dt, end_dt = candidate_to_datetimes(derived, tz)
-                            except Exception:
-                                start_dt = None
-                                end_dt = None
+                        pending_tried = True
+                        derived_slot = _try_derive_from_pending(thread, inbound.body_text, tz)
+                        if derived_slot:
+                            start_dt, end_dt = derived_slot
 
                     if start_dt and end_dt:
                         thread.scheduled_start = start_dt
@@ -331,38 +388,25 @@ class IrisCoordinationHandler:
                         thread.status = ThreadStatus.SCHEDULED
                         thread.reminder_status = "SCHEDULED"
                         thread.pending_candidate = None
-                        self.store.put(thread)
+                        self.save(thread)
                         return [], SchedulePlan(start=start_dt, end=end_dt, rationale=thread.scheduling_rationale)
 
-            if thread.pending_candidate:
-                pending_weekday = _weekday_from_candidate(thread.pending_candidate)
-                time_minutes = _extract_time_minutes(inbound.body_text)
-                if pending_weekday and time_minutes is not None:
-                    duration = thread.duration_minutes or thread.meeting_duration_minutes
-                    derived = _candidate_from_time_only(
-                        time_minutes=time_minutes,
-                        weekday=pending_weekday,
-                        duration_minutes=duration,
-                        source_text=inbound.body_text,
-                    )
-                    tz = ZoneInfo(thread.timezone)
-                    try:
-                        start_dt, end_dt = candidate_to_datetimes(derived, tz)
-                    except Exception:
-                        start_dt = None
-                        end_dt = None
-                    if start_dt and end_dt:
-                        thread.scheduled_start = start_dt
-                        thread.scheduled_end = end_dt
-                        thread.scheduling_rationale = "Explicit time requested by organizer."
-                        thread.status = ThreadStatus.SCHEDULED
-                        thread.reminder_status = "SCHEDULED"
-                        thread.pending_candidate = None
-                        self.store.put(thread)
-                        return [], SchedulePlan(start=start_dt, end=end_dt, rationale=thread.scheduling_rationale)
+            # A failed derivation above would fail identically here; only try once.
+            if thread.pending_candidate and not pending_tried:
+                derived_slot = _try_derive_from_pending(thread, inbound.body_text, get_zoneinfo(thread.timezone))
+                if derived_slot:
+                    start_dt, end_dt = derived_slot
+                    thread.scheduled_start = start_dt
+                    thread.scheduled_end = end_dt
+                    thread.scheduling_rationale = "Explicit time requested by organizer."
+                    thread.status = ThreadStatus.SCHEDULED
+                    thread.reminder_status = "SCHEDULED"
+                    thread.pending_candidate = None
+                    self.save(thread)
+                    return [], SchedulePlan(start=start_dt, end=end_dt, rationale=thread.scheduling_rationale)
 
             outbound.append(self.coordinator.start_thread(thread))
-            self.store.put(thread)
+            self.save(thread)
             return outbound, None
 
         # Ingest participant response
@@ -381,5 +425,5 @@ class IrisCoordinationHandler:
         if plan is not None:
             schedule_plan = plan
 
-        self.store.put(thread)
+        self.save(thread)
         return outbound, schedule_plan
@@ -1,30 +1,29 @@
 from __future__ import annotations
 
+import re
+from itertools import chain
 from typing import List, Dict
 from dataclasses import dataclass
 
 from .handler import IrisCoordinationHandler, InboundEmail
 from .models import MeetingThread, Participant
 
+# One case-insensitive pass over the raw body; no lowered copy, no per-keyword scans.
+_COORD_KW_RE = re.compile(r"coordinate|find a time|schedule us|schedule a time|availability", re.IGNORECASE)
+# Requests state intent up front; past this point a body is mostly quoted history.
+_COORD_KW_SCAN_CHARS = 4096
+
 
 def build_participants(from_email: str, to_emails: List[str], cc_emails: List[str], iris_email: str) -> Dict[str, Participant]:
-    # Include sender + all recipients, minus Iris
-    all_people = []
-    all_people.extend([from_email])
-    all_people.extend(to_emails)
-    all_people.extend(cc_emails)
-
-    uniq = []
-    seen = set()
-    for e in all_people:
+    # Include sender + all recipients, minus Iris; first spelling of each address wins.
+    iris_lc = iris_email.lower()
+    uniq: Dict[str, str] = {}
+    for e in chain((from_email,), to_emails, cc_emails):
         el = (e or "").strip().lower()
-        if not el or el == iris_email.lower():
-            continue
-        if el not in seen:
-            seen.add(el)
-            uniq.append(e)
+        if el and el != iris_lc:
+            uniq.setdefault(el, e)
 
-    return {e: Participant(email=e) for e in uniq}
+    return {e: Participant(email=e) for e in uniq.values()}
 
 
 def looks_like_coordination_request(ai_parsed: dict | None, body_text: str, participant_count: int) -> bool:
@@ -33,9 +32,9 @@ def looks_like_coordination_request(ai_parsed: dict | None, body_text: str, part
         # NEW_REQUEST is broad; require multiple participants to avoid hijacking 1:1 scheduling.
         return participant_count >= 2
 
-    lowered = (body_text or "").lower()
-    keywords = ("coordinate", "find a time", "schedule us", "schedule a time", "availability")
-    return participant_count >= 2 and any(k in lowered for k in keywords)
+    if participant_count < 2:
+        return False
+    return _COORD_KW_RE.search(body_text or "", 0, _COORD_KW_SCAN_CHARS) is not None
 
 
 def handle_coordination(
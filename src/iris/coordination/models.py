@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from enum import Enum
-from typing import List, Optional, Dict
+from typing import List, NamedTuple, Optional, Dict
 
 
 class ThreadStatus(str, Enum):
@@ -13,7 +13,7 @@ class ThreadStatus(str, Enum):
     NEEDS_CLARIFICATION = "NEEDS_CLARIFICATION"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeWindow:
     """A single availability window on a specific date, in minutes since midnight local to thread tz."""
     day: date
@@ -24,7 +24,7 @@ class TimeWindow:
         return 0 <= self.start_minute < self.end_minute <= 24 * 60
 
 
-@dataclass
+@dataclass(slots=True)
 class Participant:
     email: str
     has_responded: bool = False
@@ -38,7 +38,28 @@ class Participant:
     last_reminded_at: Optional[datetime] = None
 
 
-@dataclass
+class ThreadSubjects(NamedTuple):
+    """Outbound subject lines derived from a thread subject."""
+    base: str
+    availability: str
+    need_more_availability: str
+    scheduled: str
+    clarification: str
+    reminder: str
+
+    @classmethod
+    def for_subject(cls, subject: str) -> "ThreadSubjects":
+        return cls(
+            base=subject,
+            availability=f"{subject} — availability",
+            need_more_availability=f"{subject} — need more availability",
+            scheduled=f"{subject} — scheduled",
+            clarification=f"{subject} — quick clarification",
+            reminder=f"{subject} — availability reminder",
+        )
+
+
+@dataclass(slots=True)
 class MeetingThread:
     thread_id: str
     organizer_email: str
@@ -59,6 +80,16 @@ class MeetingThread:
     scheduling_rationale: Optional[str] = None
     pending_candidate: Optional[dict] = None
 
+    _subjects: Optional[ThreadSubjects] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def subjects(self) -> ThreadSubjects:
+        """Subject lines for outbound messages, built once per subject value."""
+        cached = self._subjects
+        if cached is None or cached.base != self.subject:
+            cached = self._subjects = ThreadSubjects.for_subject(self.subject)
+        return cached
+
     def pending_participants(self) -> List[Participant]:
         return [p for p in self.participants.values() if not p.has_responded]
 
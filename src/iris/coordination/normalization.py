@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 
@@ -16,6 +17,9 @@ DAY_ALIASES = {
     "sun": "sun", "sunday": "sun",
 }
 
+# Shared day offsets so date arithmetic in parser loops doesn't build a timedelta per step.
+DAY_DELTAS = tuple(timedelta(days=i) for i in range(15))
+
 TIME_RANGE_SPLIT = re.compile(r"\s*(?:–|—|-|to)\s*", re.IGNORECASE)
 
 
@@ -26,8 +30,14 @@ class ParsedTime:
     ampm: str  # "am" | "pm" | ""
 
 
+@lru_cache(maxsize=None)
+def get_zoneinfo(tz_name: str) -> ZoneInfo:
+    """Process-lifetime ZoneInfo cache; only a handful of IANA names are ever seen."""
+    return ZoneInfo(tz_name)
+
+
 def now_in_tz(tz_name: str) -> datetime:
-    return datetime.now(tz=ZoneInfo(tz_name))
+    return datetime.now(tz=get_zoneinfo(tz_name))
 
 
 def infer_year_for_mmdd(mm: int, dd: int, tz_name: str) -> int:
@@ -55,10 +65,14 @@ def to_minutes(pt: ParsedTime) -> int:
 
 
 def normalize_dash(s: str) -> str:
+    # Two str.replace calls are markedly faster than str.translate with a mapping table
+    # on strings this short; keep them.
     return s.replace("—", "–").replace("-", "–")
 
 
 def split_time_range(s: str) -> tuple[str, str] | None:
+    # One precompiled split is cheaper than a single fullmatch regex with lookaheads
+    # that rejects a second separator.
     parts = TIME_RANGE_SPLIT.split(s.strip())
     if len(parts) != 2:
         return None
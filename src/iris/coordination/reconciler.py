@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime, time
+from datetime import date, datetime, time, timedelta
 from typing import Dict, List, Optional, Tuple
-from zoneinfo import ZoneInfo
 
-from .models import MeetingThread, TimeWindow
+from .models import MeetingThread, Participant, TimeWindow
+from .normalization import get_zoneinfo
 
 
 @dataclass(frozen=True)
@@ -16,55 +15,70 @@ class ScheduledSlot:
     rationale: str
 
 
-def _intersect_two(a: List[TimeWindow], b: List[TimeWindow]) -> List[TimeWindow]:
-    # Group by date for efficiency
-    a_by = defaultdict(list)
-    b_by = defaultdict(list)
-    for w in a:
-        a_by[w.day].append(w)
-    for w in b:
-        b_by[w.day].append(w)
+def _day_masks(windows: List[TimeWindow]) -> Dict[date, int]:
+    """One participant's availability per day as an int whose bit m means "free at minute m"."""
+    masks: Dict[date, int] = {}
+    for w in windows:
+        s, e = w.start_minute, w.end_minute
+        if 0 <= s < e:
+            masks[w.day] = masks.get(w.day, 0) | (((1 << (e - s)) - 1) << s)
+    return masks
 
-    out: List[TimeWindow] = []
-    for d in set(a_by.keys()) & set(b_by.keys()):
-        for wa in a_by[d]:
-            for wb in b_by[d]:
-                s = max(wa.start_minute, wb.start_minute)
-                e = min(wa.end_minute, wb.end_minute)
-                if s < e:
-                    out.append(TimeWindow(day=d, start_minute=s, end_minute=e))
-    return out
+
+def _first_run(mask: int, length: int) -> int:
+    """Lowest bit starting `length` consecutive set bits in mask, or -1."""
+    # Invariant: bit i of mask is set iff bits i..i+span-1 of the original were all set.
+    span = 1
+    while span < length and mask:
+        step = min(span, length - span)
+        mask &= mask >> step
+        span += step
+    if not mask:
+        return -1
+    return (mask & -mask).bit_length() - 1
+
+
+def _earliest_common_start(participants: List[Participant], duration: int) -> Optional[Tuple[date, int]]:
+    """
+    Earliest (day, start_minute) where every participant is free for `duration` minutes.
+
+    Each day is a 1440-bit mask per participant; AND-ing them gives the common free minutes,
+    and a run of `duration` set bits is found with O(log duration) shift/AND steps.
+    """
+    per_participant = [_day_masks(p.parsed_windows) for p in participants]
+
+    common = per_participant[0]
+    for masks in per_participant[1:]:
+        common = {d: m & masks[d] for d, m in common.items() if d in masks}
+        if not common:
+            return None
+
+    for d in sorted(common):
+        start = _first_run(common[d], duration)
+        if start >= 0:
+            return d, start
+    return None
 
 
 def find_earliest_overlap(thread: MeetingThread) -> Optional[ScheduledSlot]:
     """
     Intersect all participants’ parsed windows and pick earliest window that can fit duration.
     """
-    tz = ZoneInfo(thread.timezone)
+    tz = get_zoneinfo(thread.timezone)
     duration = thread.meeting_duration_minutes
 
     participants = list(thread.participants.values())
     if not participants:
         return None
 
-    # Start with first participant windows, intersect progressively
-    current = participants[0].parsed_windows[:]
-    for p in participants[1:]:
-        current = _intersect_two(current, p.parsed_windows)
-        if not current:
-            return None
-
-    # Sort by date then start time
-    current.sort(key=lambda w: (w.day, w.start_minute))
-
-    for w in current:
-        if (w.end_minute - w.start_minute) < duration:
-            continue
-        start_dt = datetime.combine(w.day, time(hour=w.start_minute // 60, minute=w.start_minute % 60), tzinfo=tz)
-        end_min = w.start_minute + duration
-        end_dt = datetime.combine(w.day, time(hour=end_min // 60, minute=end_min % 60), tzinfo=tz)
+    found = _earliest_common_start(participants, duration)
+    if found is None:
+        return None
 
-        rationale = f"Earliest overlap across {len(participants)} participants on {w.day.isoformat()}."
-        return ScheduledSlot(start=start_dt, end=end_dt, rationale=rationale)
+    day, start_min = found
+    hour, minute = divmod(start_min, 60)
+    start_dt = datetime.combine(day, time(hour, minute), tzinfo=tz)
+    end_dt = start_dt + timedelta(minutes=duration)
 
-    return None
\ No newline at end of file
+    rationale = f"Earliest overlap across {len(participants)} participants on {day.isoformat()}."
+    return ScheduledSlot(start=start_dt, end=end_dt, rationale=rationale)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import asdict
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
 
 from .models import MeetingThread
 
@@ -16,6 +16,10 @@ class ThreadStore(ABC):
     def put(self, thread: MeetingThread) -> None:
         raise NotImplementedError
 
+    def batch_put(self, threads: Iterable[MeetingThread]) -> None:
+        for thread in threads:
+            self.put(thread)
+
 
 class InMemoryThreadStore(ThreadStore):
     def __init__(self) -> None:
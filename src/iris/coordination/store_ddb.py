@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-import json
 from dataclasses import asdict
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from .models import MeetingThread, Participant, TimeWindow
-from ..infra.serialization import ddb_clean, ddb_sanitize, to_json_safe
+from ..infra.serialization import ddb_clean, ddb_sanitize, from_ddb_safe, json_loads
+
+
+def _encode(value: Any) -> Any:
+    """Attribute value as stored: ISO strings for datetimes, plain dicts for windows, enum values."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, list):
+        return [_tw_to_dict(v) if isinstance(v, TimeWindow) else v for v in value]
+    return value
 
 
 def _tw_to_dict(tw: TimeWindow) -> dict:
@@ -17,13 +28,55 @@ def _tw_to_dict(tw: TimeWindow) -> dict:
     }
 
 
-def _tw_from_dict(d: dict) -> TimeWindow:
-    from datetime import date
-    return TimeWindow(
-        day=date.fromisoformat(d["day"]),
-        start_minute=int(d["start_minute"]),
-        end_minute=int(d["end_minute"]),
-    )
+def _participant_to_dict(p: Participant) -> dict:
+    return {
+        "email": p.email,
+        "has_responded": p.has_responded,
+        "raw_response_text": p.raw_response_text,
+        "parsed_windows": [_tw_to_dict(x) for x in p.parsed_windows],
+        "needs_clarification": p.needs_clarification,
+        "clarification_question": p.clarification_question,
+        "responded_at": _encode(p.responded_at),
+        "status": p.status,
+        "requested_at": _encode(p.requested_at),
+        "last_reminded_at": _encode(p.last_reminded_at),
+    }
+
+
+def _thread_fields(thread: MeetingThread) -> Dict[str, Any]:
+    """Top-level thread attributes (everything except key, bookkeeping and participants)."""
+    return {
+        "thread_id": thread.thread_id,
+        "organizer_email": thread.organizer_email,
+        "timezone": thread.timezone,
+        "meeting_duration_minutes": thread.meeting_duration_minutes,
+        "subject": thread.subject,
+        "status": _encode(thread.status),
+        "reminder_status": thread.reminder_status,
+        "reminder_schedule_name": thread.reminder_schedule_name,
+        "availability_requests_sent_at": _encode(thread.availability_requests_sent_at),
+        "deadline_at": _encode(thread.deadline_at),
+        "scheduled_start": _encode(thread.scheduled_start),
+        "scheduled_end": _encode(thread.scheduled_end),
+        "scheduling_rationale": thread.scheduling_rationale,
+        "pending_candidate": thread.pending_candidate,
+        "created_at": _encode(thread.created_at),
+    }
+
+
+# Optional ISO-8601 datetime attributes, decoded in one loop instead of one expression each.
+_PARTICIPANT_DT_FIELDS = ("responded_at", "requested_at", "last_reminded_at")
+_THREAD_DT_FIELDS = ("availability_requests_sent_at", "deadline_at", "scheduled_start", "scheduled_end")
+
+
+# UpdateItem guards: the item must exist (UpdateItem would otherwise create a partial one),
+# a legacy item must not be patched (get() would keep reading its "json"), and
+# participants.<email> paths need the participants map to exist.
+_NATIVE: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("attribute_exists", ("thread_id",)),
+    ("attribute_not_exists", ("json",)),
+)
+_NATIVE_WITH_PARTICIPANTS = _NATIVE + (("attribute_exists", ("participants",)),)
 
 
 class DdbThreadStore:
@@ -35,9 +88,17 @@ class DdbThreadStore:
       sk = "COORDINATION"
 
     If your table key schema is different, adjust _key().
+
+    Thread fields are top-level attributes and participants a map keyed by email, so
+    update_fields()/update_participant() can patch a few attributes without rewriting
+    the item. Items written as a single "json" blob by older versions still load.
     """
     def __init__(self, table):
         self._table = table
+        # thread_id -> {email: participant dict} as last read or written, for native items only.
+        # put() diffs against it to patch changed/removed participants; legacy "json" items
+        # (and threads never loaded) have no snapshot and get a full put.
+        self._snapshots: Dict[str, Dict[str, dict]] = {}
 
     def _key(self, thread_id: str) -> dict:
         # Adjust if your DDB schema differs
@@ -49,91 +110,196 @@ class DdbThreadStore:
         if not item:
             return None
 
-        data = json.loads(item["json"])
+        if "json" in item:
+            data = json_loads(item["json"])
+        else:
+            data = from_ddb_safe(item)
 
+        fromiso = datetime.fromisoformat
+        tw_fromiso = date.fromisoformat
+        TW = TimeWindow
         participants = {}
-        for email, pd in (data["participants"] or {}).items():
+        for email, pd in (data.get("participants") or {}).items():
+            pd_get = pd.get
+            raw_windows = pd_get("parsed_windows")
             p = Participant(
                 email=email,
-                has_responded=bool(pd.get("has_responded")),
-                raw_response_text=pd.get("raw_response_text"),
-                parsed_windows=[_tw_from_dict(x) for x in (pd.get("parsed_windows") or [])],
-                needs_clarification=bool(pd.get("needs_clarification")),
-                clarification_question=pd.get("clarification_question"),
-                responded_at=datetime.fromisoformat(pd["responded_at"]) if pd.get("responded_at") else None,
+                has_responded=bool(pd_get("has_responded")),
+                raw_response_text=pd_get("raw_response_text"),
+                parsed_windows=[
+                    TW(tw_fromiso(w["day"]), int(w["start_minute"]), int(w["end_minute"]))
+                    for w in raw_windows
+                ] if raw_windows else [],
+                needs_clarification=bool(pd_get("needs_clarification")),
+                clarification_question=pd_get("clarification_question"),
             )
-            p.status = pd.get("status") or ("RESPONDED" if p.has_responded else "PENDING")
-            p.requested_at = datetime.fromisoformat(pd["requested_at"]) if pd.get("requested_at") else None
-            p.last_reminded_at = datetime.fromisoformat(pd["last_reminded_at"]) if pd.get("last_reminded_at") else None
+            for k in _PARTICIPANT_DT_FIELDS:
+                v = pd_get(k)
+                setattr(p, k, fromiso(v) if v else None)
+            p.status = pd_get("status") or ("RESPONDED" if p.has_responded else "PENDING")
             participants[email] = p
 
+        data_get = data.get
         thread = MeetingThread(
             thread_id=data["thread_id"],
-            organizer_email=data["organizer_email"],
+            organizer_email=data_get("organizer_email", ""),
             participants=participants,
             timezone=data["timezone"],
-            meeting_duration_minutes=int(data.get("meeting_duration_minutes", 30)),
-            subject=data.get("subject", "Meeting"),
-        )
-        thread.status = data.get("status", thread.status)
-        thread.reminder_status = data.get("reminder_status") or thread.reminder_status
-        thread.reminder_schedule_name = data.get("reminder_schedule_name")
-        thread.availability_requests_sent_at = (
-            datetime.fromisoformat(data["availability_requests_sent_at"])
-            if data.get("availability_requests_sent_at")
-            else None
+            meeting_duration_minutes=int(data_get("meeting_duration_minutes", 30)),
+            subject=data_get("subject", "Meeting"),
         )
-        thread.deadline_at = datetime.fromisoformat(data["deadline_at"]) if data.get("deadline_at") else None
-        if data.get("created_at"):
-            thread.created_at = datetime.fromisoformat(data["created_at"])
-
-        thread.scheduled_start = datetime.fromisoformat(data["scheduled_start"]) if data.get("scheduled_start") else None
-        thread.scheduled_end = datetime.fromisoformat(data["scheduled_end"]) if data.get("scheduled_end") else None
-        thread.scheduling_rationale = data.get("scheduling_rationale")
-        thread.pending_candidate = data.get("pending_candidate")
+        thread.status = data_get("status", thread.status)
+        thread.reminder_status = data_get("reminder_status") or thread.reminder_status
+        thread.reminder_schedule_name = data_get("reminder_schedule_name")
+        for k in _THREAD_DT_FIELDS:
+            v = data_get(k)
+            setattr(thread, k, fromiso(v) if v else None)
+        if data_get("created_at"):
+            thread.created_at = fromiso(data["created_at"])
+        thread.scheduling_rationale = data_get("scheduling_rationale")
+        thread.pending_candidate = data_get("pending_candidate")
 
+        if "json" in item:
+            self._snapshots.pop(thread_id, None)
+        else:
+            self._snapshot(thread)
         return thread
 
+    def _snapshot(self, thread: MeetingThread) -> Dict[str, dict]:
+        snap = {e: _participant_to_dict(p) for e, p in thread.participants.items()}
+        self._snapshots[thread.thread_id] = snap
+        return snap
+
     def put(self, thread: MeetingThread) -> None:
-        def participant_to_dict(p: Participant) -> dict:
-            return {
-                "email": p.email,
-                "has_responded": p.has_responded,
-                "raw_response_text": p.raw_response_text,
-                "parsed_windows": [_tw_to_dict(x) for x in p.parsed_windows],
-                "needs_clarification": p.needs_clarification,
-                "clarification_question": p.clarification_question,
-                "responded_at": p.responded_at.isoformat() if p.responded_at else None,
-                "status": p.status,
-                "requested_at": p.requested_at.isoformat() if p.requested_at else None,
-                "last_reminded_at": p.last_reminded_at.isoformat() if p.last_reminded_at else None,
-            }
-
-        data = {
-            "thread_id": thread.thread_id,
-            "organizer_email": thread.organizer_email,
-            "participants": {e: participant_to_dict(p) for e, p in thread.participants.items()},
-            "timezone": thread.timezone,
-            "meeting_duration_minutes": thread.meeting_duration_minutes,
-            "subject": thread.subject,
-            "status": thread.status,
-            "reminder_status": thread.reminder_status,
-            "reminder_schedule_name": thread.reminder_schedule_name,
-            "availability_requests_sent_at": thread.availability_requests_sent_at.isoformat()
-            if thread.availability_requests_sent_at else None,
-            "deadline_at": thread.deadline_at.isoformat() if thread.deadline_at else None,
-            "scheduled_start": thread.scheduled_start.isoformat() if thread.scheduled_start else None,
-            "scheduled_end": thread.scheduled_end.isoformat() if thread.scheduled_end else None,
-            "scheduling_rationale": thread.scheduling_rationale,
-            "pending_candidate": thread.pending_candidate,
-            "created_at": thread.created_at.isoformat() if thread.created_at else None,
-        }
-
-        self._table.put_item(
-            Item=ddb_clean(ddb_sanitize({
-                **self._key(thread.thread_id),
-                "record_type": "COORDINATION_THREAD",
-                "updated_at": datetime.utcnow().isoformat() + "Z",
-                "json": json.dumps(to_json_safe(data)),
-            }))
+        """
+        Full put_item for a new or legacy thread. For a native thread loaded by get(), a single
+        UpdateItem rewrites the thread fields and only the participants added, changed or
+        removed since the last read/write.
+        """
+        before = self._snapshots.get(thread.thread_id)
+        if before is None:
+            self._put_full(thread)
+            return
+
+        current = {e: _participant_to_dict(p) for e, p in thread.participants.items()}
+        paths: Dict[Tuple[str, ...], Any] = {(k,): v for k, v in _thread_fields(thread).items()}
+        conditions = _NATIVE
+        if before and current:
+            for email, pd in current.items():
+                if before.get(email) != pd:
+                    paths[("participants", email)] = ddb_clean(pd)
+            for email in before.keys() - current.keys():
+                paths[("participants", email)] = None
+            conditions = _NATIVE_WITH_PARTICIPANTS
+        elif before or current:
+            # The map is being created or emptied: write (or REMOVE) it whole.
+            paths[("participants",)] = {e: ddb_clean(pd) for e, pd in current.items()} or None
+
+        if self._update(thread.thread_id, paths, conditions):
+            self._snapshots[thread.thread_id] = current
+        else:
+            self._put_full(thread)
+
+    def _put_full(self, thread: MeetingThread) -> None:
+        # Replacing the whole item also drops a legacy "json" blob.
+        self._table.put_item(Item=self._to_item(thread))
+        self._snapshot(thread)
+
+    def batch_put(self, threads: Iterable[MeetingThread]) -> None:
+        # batch_writer groups puts into BatchWriteItem calls (25 per request) and retries unprocessed items.
+        with self._table.batch_writer(overwrite_by_pkeys=["pk", "sk"]) as batch:
+            for thread in threads:
+                batch.put_item(Item=self._to_item(thread))
+                self._snapshot(thread)
+
+    def update_fields(self, thread_id: str, **fields: Any) -> None:
+        """
+        SET the given top-level thread attributes in place; None values are REMOVEd.
+        A legacy "json" item is loaded, changed and rewritten in full instead.
+        """
+        if self._update(thread_id, {(k,): v for k, v in fields.items()}, _NATIVE):
+            return
+        thread = self.get(thread_id)
+        if thread is None:
+            return
+        for k, v in fields.items():
+            setattr(thread, k, v)
+        self._put_full(thread)
+
+    def update_participant(self, thread_id: str, email: str, **fields: Any) -> None:
+        """
+        Patch one participant's attributes in place. If the item is legacy or doesn't hold
+        that participant yet, the thread is loaded, changed and rewritten in full instead.
+        """
+        paths = {("participants", email, k): v for k, v in fields.items()}
+        if self._update(thread_id, paths, _NATIVE + (("attribute_exists", ("participants", email)),)):
+            return
+        thread = self.get(thread_id)
+        if thread is None:
+            return
+        p = thread.participants.get(email)
+        if p is None:
+            p = thread.participants[email] = Participant(email=email)
+        for k, v in fields.items():
+            setattr(p, k, v)
+        self._put_full(thread)
+
+    def _update(
+        self,
+        thread_id: str,
+        paths: Dict[Tuple[str, ...], Any],
+        conditions: Tuple[Tuple[str, Tuple[str, ...]], ...],
+    ) -> bool:
+        """
+        One UpdateItem for the given paths, guarded by (function, path) conditions.
+        Returns False (nothing written) when a condition fails.
+        """
+        aliases: Dict[str, str] = {}  # attribute name / email -> "#nX" placeholder
+        values: Dict[str, Any] = {}
+        sets = []
+        removes = []
+
+        def alias(part: str) -> str:
+            if part not in aliases:
+                aliases[part] = f"#n{len(aliases)}"
+            return aliases[part]
+
+        paths = {**paths, ("updated_at",): datetime.utcnow().isoformat() + "Z"}
+        for path, value in paths.items():
+            target = ".".join(alias(part) for part in path)
+            value = _encode(value)
+            if value is None:
+                removes.append(target)
+            else:
+                placeholder = f":v{len(values)}"
+                values[placeholder] = value
+                sets.append(f"{target} = {placeholder}")
+
+        expr = "SET " + ", ".join(sets)
+        if removes:
+            expr += " REMOVE " + ", ".join(removes)
+        condition = " AND ".join(
+            f"{fn}({'.'.join(alias(part) for part in path)})" for fn, path in conditions
         )
+        try:
+            self._table.update_item(
+                Key=self._key(thread_id),
+                UpdateExpression=expr,
+                ConditionExpression=condition,
+                ExpressionAttributeNames={v: k for k, v in aliases.items()},
+                ExpressionAttributeValues=ddb_sanitize(values),
+            )
+        except Exception as e:
+            if getattr(e, "response", {}).get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                return False
+            raise
+        return True
+
+    def _to_item(self, thread: MeetingThread) -> dict:
+        return ddb_clean(ddb_sanitize({
+            **self._key(thread.thread_id),
+            "record_type": "COORDINATION_THREAD",
+            "updated_at": datetime.utcnow().isoformat() + "Z",
+            "participants": {e: _participant_to_dict(p) for e, p in thread.participants.items()},
+            **_thread_fields(thread),
+        }))
@@ -1,30 +1,34 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from typing import List
 
 from .types import OutboundMessage
 
+_AVAILABILITY_REQUEST_INTRO = (
+    "Hi everyone — I’ll coordinate this meeting.\n\n"
+    "Please reply with your availability using this format (one or more lines):\n\n"
+    "Day, MM/DD: start–end, start–end\n\n"
+    "Examples:\n"
+    "Tue, 02/11: 1pm–3pm, 4:30pm–5pm\n"
+    "Wed, 02/12: 9–11am\n\n"
+    "Notes:\n"
+    "- You can write `4–5pm` or `4pm–5pm` — I’ll interpret both.\n"
+    "- You can include multiple days.\n\n"
+    "Flexible constraints are also OK, for example:\n"
+    "- “Any afternoon Mon–Wed next week”\n"
+    "- “Any time after 3pm on Wednesday”\n"
+    "- “Any 30 min slot Tue–Thu between 10am–4pm PT”\n\n"
+)
+
+
 def availability_request_email(participant_emails: List[str], deadline: datetime | None, tz_name: str) -> str:
     deadline_str = f"{deadline.strftime('%a %m/%d %I:%M%p')} {tz_name}" if deadline else "soon"
-    return (
-        "Hi everyone — I’ll coordinate this meeting.\n\n"
-        "Please reply with your availability using this format (one or more lines):\n\n"
-        "Day, MM/DD: start–end, start–end\n\n"
-        "Examples:\n"
-        "Tue, 02/11: 1pm–3pm, 4:30pm–5pm\n"
-        "Wed, 02/12: 9–11am\n\n"
-        "Notes:\n"
-        "- You can write `4–5pm` or `4pm–5pm` — I’ll interpret both.\n"
-        "- You can include multiple days.\n\n"
-        "Flexible constraints are also OK, for example:\n"
-        "- “Any afternoon Mon–Wed next week”\n"
-        "- “Any time after 3pm on Wednesday”\n"
-        "- “Any 30 min slot Tue–Thu between 10am–4pm PT”\n\n"
-        f"Please reply by {deadline_str} so I can schedule promptly.\n"
-    )
+    return f"{_AVAILABILITY_REQUEST_INTRO}Please reply by {deadline_str} so I can schedule promptly.\n"
 
 
+@lru_cache(maxsize=256)
 def clarification_email(question: str) -> str:
     return (
         "Quick clarification so I don’t schedule the wrong time:\n\n"
@@ -1,23 +1,38 @@
 from __future__ import annotations
 
 import json
-from typing import Optional, List
+import re
+from typing import Iterable, Optional, List
 from email.utils import getaddresses
 import email
 from email import policy
+from email.parser import BytesHeaderParser
 
 from ..infra.serialization import to_json_safe
+
+# One comma-separated entry of a plain address header: "addr" or "Simple Name <addr>".
+# Anything fancier (quoted names, comments, encoded words) goes to getaddresses.
+_SIMPLE_ADDR_RE = re.compile(r"\s*(?:[A-Za-z0-9 ._'-]*?\s*<([\w.+\-]+@[\w\-.]+)>|([\w.+\-]+@[\w\-.]+))\s*")
+
+
 def flatten_emails(header_value: Optional[str]) -> List[str]:
     if not header_value:
         return []
-    return [addr.lower() for _, addr in getaddresses([header_value]) if addr]
+    out: List[str] = []
+    for entry in header_value.split(","):
+        m = _SIMPLE_ADDR_RE.fullmatch(entry)
+        if m is None:
+            return [addr.lower() for _, addr in getaddresses([header_value]) if addr]
+        out.append((m.group(1) or m.group(2)).lower())
+    return out
 
 
-def dedupe(seq: List[str]) -> List[str]:
+def dedupe(seq: Iterable[str], skip: Optional[str] = None) -> List[str]:
+    """Order-preserving dedupe that drops empty values and, optionally, one excluded value."""
     seen = set()
     out: List[str] = []
     for x in seq:
-        if x and x not in seen:
+        if x and x != skip and x not in seen:
             seen.add(x)
             out.append(x)
     return out
@@ -33,10 +48,16 @@ def safe_json(obj) -> str:
 def extract_plaintext_body(eml: email.message.EmailMessage) -> str:
     body_text = ""
     if eml.is_multipart():
-        for part in eml.walk():
-            if part.get_content_type() == "text/plain":
-                body_text = part.get_content()
-                break
+        # get_body() only follows the multipart structure toward the body and skips
+        # attachments; the full walk is a fallback for layouts it doesn't recognize.
+        body = eml.get_body(preferencelist=("plain",))
+        if body is not None:
+            body_text = body.get_content()
+        else:
+            for part in eml.walk():
+                if part.get_content_type() == "text/plain":
+                    body_text = part.get_content()
+                    break
     else:
         body_text = eml.get_content()
     return body_text or ""
@@ -44,3 +65,13 @@ def extract_plaintext_body(eml: email.message.EmailMessage) -> str:
 
 def parse_eml(raw_bytes: bytes) -> email.message.EmailMessage:
     return email.message_from_bytes(raw_bytes, policy=policy.default)
+
+
+_HEADER_PARSER = BytesHeaderParser(policy=policy.default)
+_HEADER_END_RE = re.compile(rb"\r?\n\r?\n")
+
+
+def parse_eml_headers(raw_bytes: bytes) -> email.message.EmailMessage:
+    """Top-level headers only; the body (and any attachments) is not read at all."""
+    m = _HEADER_END_RE.search(raw_bytes)
+    return _HEADER_PARSER.parsebytes(raw_bytes[:m.end()] if m else raw_bytes)
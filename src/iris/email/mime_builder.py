@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import email
 from email import policy
+from functools import lru_cache
 from typing import Optional, List
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from datetime import datetime, timezone
 from email.utils import formataddr
 
 from ..infra.config import TIMEZONE
@@ -22,7 +22,7 @@ def build_ics(
     location: Optional[str] = None,
     url: Optional[str] = None,
 ) -> str:
-    dtstamp = datetime.now(tz=ZoneInfo("UTC")).strftime("%Y%m%dT%H%M%SZ")
+    dtstamp = datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
     def fmt(dt: datetime) -> str:
         return dt.strftime("%Y%m%dT%H%M%S")
@@ -56,6 +56,35 @@ def build_ics(
     return "\r\n".join(lines)
 
 
+@lru_cache(maxsize=128)
+def _header(name: str, value: str):
+    # Parsing a header value (address lists especially) costs more than the rest of the
+    # message. Header objects are immutable, and EmailMessage stores a pre-parsed one
+    # as-is, so From/To/In-Reply-To/References repeated across replies parse once.
+    # Storing a pre-built header also skips the policy's CR/LF check, so repeat it here
+    # (a decoded inbound Subject can carry "\r\nBcc: ..." into "Re: {subject}").
+    if len(value.splitlines()) > 1:
+        raise ValueError("Header values may not contain linefeed or carriage return characters")
+    return policy.default.header_factory(name, value)
+
+
+def _set_reply_headers(
+    msg: email.message.EmailMessage,
+    subject: str,
+    from_addr: str,
+    to_addrs: List[str],
+    in_reply_to: Optional[str],
+    references: Optional[str],
+) -> None:
+    msg["Subject"] = _header("Subject", subject)
+    msg["From"] = _header("From", formataddr((DISPLAY_NAME, from_addr)))
+    msg["To"] = _header("To", ", ".join(to_addrs))
+    if in_reply_to:
+        msg["In-Reply-To"] = _header("In-Reply-To", in_reply_to)
+    if references:
+        msg["References"] = _header("References", references)
+
+
 def build_raw_mime_text_reply(
     subject: str,
     text_body: str,
@@ -65,13 +94,7 @@ def build_raw_mime_text_reply(
     references: Optional[str],
 ) -> bytes:
     msg = email.message.EmailMessage()
-    msg["Subject"] = subject
-    msg["From"] = formataddr((DISPLAY_NAME, from_addr))
-    msg["To"] = ", ".join(to_addrs)
-    if in_reply_to:
-        msg["In-Reply-To"] = in_reply_to
-    if references:
-        msg["References"] = references
+    _set_reply_headers(msg, subject, from_addr, to_addrs, in_reply_to, references)
     msg.set_content(text_body)
     return msg.as_bytes(policy=policy.SMTP)
 
@@ -86,13 +109,7 @@ def build_raw_mime_reply_with_ics(
     references: Optional[str],
 ) -> bytes:
     msg = email.message.EmailMessage()
-    msg["Subject"] = subject
-    msg["From"] = formataddr((DISPLAY_NAME, from_addr))
-    msg["To"] = ", ".join(to_addrs)
-    if in_reply_to:
-        msg["In-Reply-To"] = in_reply_to
-    if references:
-        msg["References"] = references
+    _set_reply_headers(msg, subject, from_addr, to_addrs, in_reply_to, references)
 
     msg.set_content(text_body)
     msg.add_attachment(
@@ -15,6 +15,8 @@ MAX_NAME = 120
 MAX_EMAIL = 254
 MAX_MESSAGE = 4000
 
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 def _resp(status, body, origin=None):
     headers = {"Content-Type": "application/json"}
@@ -48,12 +50,13 @@ def _origin(event):
 
 
 def _is_valid_email(addr: str) -> bool:
-    if not addr or len(addr) > MAX_EMAIL:
+    # Cheap rejects before the RFC 2822 parse.
+    if not addr or len(addr) > MAX_EMAIL or "@" not in addr:
         return False
     _, email = parseaddr(addr)
     if not email or "@" not in email:
         return False
-    return bool(re.match(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", email))
+    return _EMAIL_RE.match(email) is not None
 
 
 def lambda_handler(event, context):
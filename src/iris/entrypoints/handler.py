@@ -1,24 +1,25 @@
 from __future__ import annotations
 
-import json
 import uuid
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from zoneinfo import ZoneInfo
-from botocore.exceptions import ClientError
+from itertools import chain
+from typing import Dict
 
 from ..infra.config import BUCKET_NAME, IRIS_EMAIL, TIMEZONE, DEFAULT_DURATION_MINUTES, require_env
 from ..infra.aws_clients import table as _table, ses as _ses
 from ..infra.ddb import key_for_message
-from ..infra.serialization import ddb_clean, ddb_sanitize, to_json_safe
+from ..infra.serialization import ddb_clean, ddb_sanitize, to_json_safe, json_dumps_compact
 from ..infra.threading import extract_message_ids, resolve_thread_id, upsert_thread_aliases
-from ..email.email_utils import flatten_emails, dedupe, safe_json, extract_plaintext_body, parse_eml
+from ..email.email_utils import flatten_emails, dedupe, safe_json, extract_plaintext_body, parse_eml, parse_eml_headers
 from ..infra.s3_loader import load_email_bytes_from_s3
 from ..scheduling.scheduling import next_day_at_default_time, candidate_to_datetimes
 from ..email.mime_builder import build_ics, build_raw_mime_text_reply, build_raw_mime_reply_with_ics
 from ..infra.google_calendar import create_meet_event
 from ..infra.coordination_store import CoordinationStore
 from ..coordination.models import MeetingThread, Participant, ThreadStatus
+from ..coordination.normalization import get_zoneinfo
 from ..infra.reminders import ensure_reminder_schedule
 from ..conversation.engine import process_incoming_email
 from ..conversation.guardrails import apply_input_guardrail
@@ -31,6 +32,9 @@ from iris_ai_parser import parse_email
 # Thread identification
 # -------------------------
 
+_MSGID_RE = re.compile(r"<([^>]+)>")
+
+
 def _extract_thread_root_id(eml: dict, fallback_message_id: str) -> str:
     """
     Deprecated: use infra.threading.resolve_thread_id instead.
@@ -39,10 +43,18 @@ def _extract_thread_root_id(eml: dict, fallback_message_id: str) -> str:
     def _first_msgid(value: str) -> str:
         if not value:
             return ""
-        ids = re.findall(r"<([^>]+)>", value)
-        if ids:
-            return ids[0]
-        return value.strip().strip("<>").split()[0]
+        # Common case: the first "<...>" found with two str.find calls, no regex.
+        lt = value.find("<")
+        if lt != -1:
+            gt = value.find(">", lt + 1)
+            if gt > lt + 1:
+                return value[lt + 1:gt]
+        # Only the first id is used; search() avoids materializing every id in long References.
+        m = _MSGID_RE.search(value)
+        if m:
+            return m.group(1)
+        parts = value.strip().strip("<>").split()
+        return parts[0] if parts else ""
 
     refs = eml.get("References") or ""
     root = _first_msgid(str(refs))
@@ -61,10 +73,29 @@ def _extract_thread_root_id(eml: dict, fallback_message_id: str) -> str:
 # Main handler
 # -------------------------
 
-def _append_line(existing: str | None, line: str) -> str:
-    if existing and existing.strip():
-        return existing.rstrip() + "\n" + line
-    return line
+# Reused across warm invocations; threads are only started on first submit.
+_IO = ThreadPoolExecutor(max_workers=4)
+_IDEMPOTENCY_PROJECTION = "invite_sent_at, clarification_sent_at, guardrail_blocked_at"
+_IRIS_DOMAIN = IRIS_EMAIL.partition("@")[2]
+# Fixed response bodies, serialized once at import.
+_BODY_SKIPPED = json_dumps_compact({"ok": True, "skipped": True})
+_BODY_MISSING_FROM = json_dumps_compact({"error": "missing From"})
+_BODY_FROM_IRIS = json_dumps_compact({"ok": True, "ignored": "from_iris"})
+_BODY_NOT_RECIPIENT = json_dumps_compact({"ok": True, "ignored": "iris_not_recipient"})
+_BODY_GUARDRAIL_BLOCKED = json_dumps_compact({"ok": True, "action": "guardrail_blocked"})
+_BODY_COORDINATION = json_dumps_compact({"ok": True, "action": "coordination"})
+_BODY_CLARIFY = json_dumps_compact({"ok": True, "action": "clarify"})
+_BODY_SCHEDULED = json_dumps_compact({"ok": True, "action": "scheduled"})
+# message_ids this container has already seen with a *_sent_at / guardrail marker in DDB.
+# Markers are never cleared, so a hit is as good as the GetItem; oldest ids are evicted first.
+_HANDLED_IDS: Dict[str, None] = {}
+_HANDLED_IDS_MAX = 1024
+
+
+def _remember_handled(message_id: str) -> None:
+    _HANDLED_IDS[message_id] = None
+    if len(_HANDLED_IDS) > _HANDLED_IDS_MAX:
+        del _HANDLED_IDS[next(iter(_HANDLED_IDS))]
 
 
 def _timezone_name_from_dt(dt: datetime) -> str:
@@ -86,43 +117,57 @@ def handle_ses_event(event: dict) -> dict:
     message_id = mail.get("messageId") or str(uuid.uuid4())
     print(f"[ses] messageId={message_id}")
 
+    # One timestamp per invocation for every *_at field written below.
+    now = datetime.utcnow()
+    now_iso = now.isoformat() + "Z"
+
     # ---- DDB idempotency ----
+    # This read has to happen before any email goes out, so it can't be folded into the
+    # final conditional write; it fetches only the *_sent_at / guardrail markers.
+    if message_id in _HANDLED_IDS:
+        print(f"[ddb] idempotent skip (cached) message_id={message_id}")
+        return {"statusCode": 200, "body": _BODY_SKIPPED}
     ddb_key = key_for_message(message_id)
-    existing = _table().get_item(Key=ddb_key).get("Item")
+    table = _table()
+    existing = table.get_item(Key=ddb_key, ProjectionExpression=_IDEMPOTENCY_PROJECTION).get("Item")
     if existing and (
         existing.get("invite_sent_at")
         or existing.get("clarification_sent_at")
         or existing.get("guardrail_blocked_at")
     ):
         print(f"[ddb] idempotent skip message_id={message_id}")
-        return {"statusCode": 200, "body": json.dumps({"ok": True, "skipped": True})}
+        _remember_handled(message_id)
+        return {"statusCode": 200, "body": _BODY_SKIPPED}
 
     raw_bytes, used_key = load_email_bytes_from_s3(BUCKET_NAME, message_id, receipt)
-    eml = parse_eml(raw_bytes)
+    # The loop/recipient filters below only need headers; the full MIME parse waits until
+    # the message is known to be for Iris.
+    headers = parse_eml_headers(raw_bytes)
 
-    subject = eml.get("Subject", "(no subject)")
-    from_email_list = flatten_emails(eml.get("From"))[:1]
+    subject = headers.get("Subject", "(no subject)")
+    from_email_list = flatten_emails(headers.get("From"))[:1]
     if not from_email_list:
-        return {"statusCode": 400, "body": json.dumps({"error": "missing From"})}
+        return {"statusCode": 400, "body": _BODY_MISSING_FROM}
+    # flatten_emails lowercases, and config.IRIS_EMAIL is stored lowercased, so the
+    # address comparisons below need no further .lower() calls.
     from_email = from_email_list[0]
 
-    to_emails = flatten_emails(eml.get("To"))
-    cc_emails = flatten_emails(eml.get("Cc"))
-
-    # Who should receive Iris' replies
-    reply_recipients = dedupe([from_email] + to_emails + cc_emails)
+    # Ignore messages sent BY Iris (avoid loops)
+    if from_email == IRIS_EMAIL:
+        return {"statusCode": 200, "body": _BODY_FROM_IRIS}
 
-    to_set = {e.lower() for e in to_emails}
-    cc_set = {e.lower() for e in cc_emails}
+    to_emails = flatten_emails(headers.get("To"))
+    cc_emails = flatten_emails(headers.get("Cc"))
 
-    # Ignore messages sent BY Iris (avoid loops)
-    if from_email.lower() == IRIS_EMAIL.lower():
-        return {"statusCode": 200, "body": json.dumps({"ok": True, "ignored": "from_iris"})}
+    # Process if Iris is in To or Cc (Iris might be in either).
+    # flatten_emails already lowercases, so plain membership short-circuits on the first hit.
+    if IRIS_EMAIL not in to_emails and IRIS_EMAIL not in cc_emails:
+        return {"statusCode": 200, "body": _BODY_NOT_RECIPIENT}
 
-    # Process if Iris is in To or Cc (Iris might be in either)
-    if IRIS_EMAIL.lower() not in to_set and IRIS_EMAIL.lower() not in cc_set:
-        return {"statusCode": 200, "body": json.dumps({"ok": True, "ignored": "iris_not_recipient"})}
+    # Who should receive Iris' replies
+    reply_recipients = dedupe(chain([from_email], to_emails, cc_emails))
 
+    eml = parse_eml(raw_bytes)
     body_text = extract_plaintext_body(eml)
 
     # Compute canonical thread id early and use it everywhere
@@ -130,11 +175,11 @@ def handle_ses_event(event: dict) -> dict:
     if message_id and message_id not in candidates:
         candidates.append(message_id)
 
-    thread_id = resolve_thread_id(eml, message_id, _table())
+    thread_id = resolve_thread_id(eml, message_id, table)
     print("[thread] resolved thread_id=", thread_id, " candidates=", candidates)
 
     # Upsert aliases for all candidate IDs
-    upsert_thread_aliases(_table(), candidates, thread_id)
+    upsert_thread_aliases(table, candidates, thread_id)
 
     # ---- Bedrock Guardrails (INPUT) ----
     allowed, block_msg, guardrail_resp = apply_input_guardrail(body_text)
@@ -157,25 +202,24 @@ def handle_ses_event(event: dict) -> dict:
         )
 
         # Ensure reminders exist even for single-participant threads.
-        store = CoordinationStore(_table())
+        store = CoordinationStore(table)
         thread = store.get(thread_id)
-        now = datetime.utcnow()
         if not thread:
-            p = Participant(email=from_email.lower())
+            p = Participant(email=from_email)
             p.status = "PENDING"
             p.requested_at = now
             thread = MeetingThread(
                 thread_id=thread_id,
-                organizer_email=from_email.lower(),
+                organizer_email=from_email,
                 participants={p.email: p},
                 timezone=thread_state.timezone or TIMEZONE,
                 meeting_duration_minutes=DEFAULT_DURATION_MINUTES,
                 subject=subject,
             )
         else:
-            p = thread.participants.get(from_email.lower())
+            p = thread.participants.get(from_email)
             if not p:
-                p = Participant(email=from_email.lower())
+                p = Participant(email=from_email)
                 thread.participants[p.email] = p
             p.status = "PENDING"
             p.requested_at = p.requested_at or now
@@ -197,16 +241,17 @@ def handle_ses_event(event: dict) -> dict:
             "thread_id": thread_id,
             "subject": subject,
             "from_email": from_email,
-            "to_emails": list(to_emails),
-            "cc_emails": list(cc_emails),
+            "to_emails": to_emails,
+            "cc_emails": cc_emails,
             "s3_key": used_key,
-            "received_at": datetime.utcnow().isoformat() + "Z",
-            "guardrail_blocked_at": datetime.utcnow().isoformat() + "Z",
-            "guardrail_json": json.dumps(to_json_safe(guardrail_resp)) if guardrail_resp else "{}",
+            "received_at": now_iso,
+            "guardrail_blocked_at": now_iso,
+            "guardrail_json": json_dumps_compact(to_json_safe(guardrail_resp)) if guardrail_resp else "{}",
         })
-        _table().put_item(Item=ddb_clean(ddb_sanitize(item)))
+        table.put_item(Item=ddb_clean(ddb_sanitize(item)))
+        _remember_handled(message_id)
 
-        return {"statusCode": 200, "body": json.dumps({"ok": True, "action": "guardrail_blocked"})}
+        return {"statusCode": 200, "body": _BODY_GUARDRAIL_BLOCKED}
 
     # ---- AI parse (use real thread_id, not thread#message_id) ----
     ai_result = parse_email({
@@ -218,10 +263,12 @@ def handle_ses_event(event: dict) -> dict:
     print("[ai] result=", safe_json(ai_result))
 
     ai_parsed_raw = (ai_result.get("parsed") or {}) if ai_result.get("ok") else None
+    # ddb_sanitize is copy-on-write, so ai_parsed may be ai_parsed_raw itself (or share its
+    # nested lists/dicts). Neither is mutated below; copy first if that ever changes.
     ai_parsed = ddb_sanitize(ai_parsed_raw) if ai_parsed_raw else None  # critical for DDB + engine safety
 
     # ---- Multi participant routing (deterministic) ----
-    store = CoordinationStore(_table())
+    store = CoordinationStore(table)
     existing_thread = store.get(thread_id)
     existing_participants = list(existing_thread.participants.keys()) if existing_thread else []
 
@@ -229,8 +276,8 @@ def handle_ses_event(event: dict) -> dict:
         participants_all = existing_participants
         is_multi = True
     else:
-        participants_all = dedupe([from_email] + to_emails + cc_emails)
-        participants_all = [e for e in participants_all if e and e.lower() != IRIS_EMAIL.lower()]
+        # Same people as reply_recipients, minus Iris.
+        participants_all = dedupe(reply_recipients, skip=IRIS_EMAIL)
         is_multi = len(participants_all) >= 2
 
     print("[coord] participants_all=", participants_all)
@@ -244,11 +291,14 @@ def handle_ses_event(event: dict) -> dict:
         from ..coordination.handler import IrisCoordinationHandler, InboundEmail
         from ..coordination.models import MeetingThread, Participant
 
-        coord_thread = store.get(thread_id)
+        # Thread writes are buffered and flushed in one batch once handle() has updated the
+        # thread, before any email goes out.
+        handler = IrisCoordinationHandler(store, auto_flush=False)
+        coord_thread = existing_thread
 
         is_new = coord_thread is None
         if is_new:
-            participants = {e.lower(): Participant(email=e.lower()) for e in participants_all}
+            participants = {e: Participant(email=e) for e in participants_all}
             coord_thread = MeetingThread(
                 thread_id=thread_id,
                 organizer_email=from_email,
@@ -256,9 +306,8 @@ def handle_ses_event(event: dict) -> dict:
                 timezone=TIMEZONE,
                 subject=subject,
             )
-            store.put(coord_thread)
+            handler.save(coord_thread)
 
-        handler = IrisCoordinationHandler(store)
         inbound = InboundEmail(
             thread_id=thread_id,
             from_email=from_email,
@@ -271,24 +320,38 @@ def handle_ses_event(event: dict) -> dict:
         )
 
         outbound_msgs, schedule_plan = handler.handle(inbound)
+        # Persist the new thread state first: if a send or the reminder scheduling below fails,
+        # an SES redelivery sees the updated thread instead of re-running the step that mailed.
+        handler.flush()
 
         if schedule_plan:
             # Avoid double-notifying: we will send ICS invite below.
             outbound_msgs = [m for m in outbound_msgs if " — scheduled" not in (m.subject or "")]
 
-        for m in outbound_msgs:
+        ses_client = _ses()
+        in_reply_to = eml.get("Message-Id")
+        references = eml.get("References")
+
+        def send_outbound(m) -> None:
             raw_mime = build_raw_mime_text_reply(
                 subject=m.subject,
                 text_body=(m.body or "").rstrip() + "\n",
                 from_addr=IRIS_EMAIL,
                 to_addrs=m.to,
-                in_reply_to=eml.get("Message-Id"),
-                references=eml.get("References"),
+                in_reply_to=in_reply_to,
+                references=references,
             )
-            _ses().send_raw_email(Source=IRIS_EMAIL, Destinations=m.to, RawMessage={"Data": raw_mime})
+            ses_client.send_raw_email(Source=IRIS_EMAIL, Destinations=m.to, RawMessage={"Data": raw_mime})
+
+        if len(outbound_msgs) == 1:
+            send_outbound(outbound_msgs[0])
+        elif outbound_msgs:
+            # Independent messages: overlap the SES round-trips (and each one's MIME build with
+            # the others' network wait). Draining map() re-raises the first failure.
+            list(_IO.map(send_outbound, outbound_msgs))
 
         if schedule_plan:
-            event_uid = f"{uuid.uuid4()}@{IRIS_EMAIL.split('@', 1)[1]}"
+            event_uid = f"{uuid.uuid4()}@{_IRIS_DOMAIN}"
             attendees = participants_all[:]  # already excludes Iris
 
             meet_url = None
@@ -306,13 +369,10 @@ def handle_ses_event(event: dict) -> dict:
             except Exception as e:
                 print("[meet] create failed", repr(e))
 
-            description = None
-            location = None
-            url = None
+            description = location = url = None
             if meet_url:
-                description = _append_line(description, f"Google Meet: {meet_url}")
-                location = _append_line(location, meet_url)
-                url = _append_line(url, meet_url)
+                description = f"Google Meet: {meet_url}"
+                location = url = meet_url
 
             ics = build_ics(
                 subject=subject,
@@ -344,14 +404,14 @@ def handle_ses_event(event: dict) -> dict:
             _ses().send_raw_email(Source=IRIS_EMAIL, Destinations=attendees, RawMessage={"Data": raw_mime})
 
         if is_new:
-            refreshed = store.get(thread_id)
+            refreshed = handler.get(thread_id)
             if refreshed and refreshed.availability_requests_sent_at:
                 should_schedule = refreshed.reminder_status in (None, "", "COLLECTING_AVAILABILITY")
                 if should_schedule and not refreshed.reminder_schedule_name:
                     schedule_name = ensure_reminder_schedule(thread_id)
                     if schedule_name:
                         refreshed.reminder_schedule_name = schedule_name
-                        store.put(refreshed)
+                        handler.save(refreshed)
 
         # Message record (store ai_raw as string; don't store floats directly)
         item = key_for_message(message_id)
@@ -360,23 +420,24 @@ def handle_ses_event(event: dict) -> dict:
             "thread_id": thread_id,
             "subject": subject,
             "from_email": from_email,
-            "to_emails": list(to_emails),
-            "cc_emails": list(cc_emails),
+            "to_emails": to_emails,
+            "cc_emails": cc_emails,
             "s3_key": used_key,
-            "received_at": datetime.utcnow().isoformat() + "Z",
+            "received_at": now_iso,
             "ai_raw": ai_result.get("raw") if isinstance(ai_result, dict) else None,
             "coord_action": "handled_multi",
         })
-        _table().put_item(Item=ddb_clean(ddb_sanitize(item)))
+        # Only the reminder name (if one was just scheduled) can still be buffered here.
+        store.batch_put(handler.drain(), extra_items=[ddb_clean(ddb_sanitize(item))])
 
-        return {"statusCode": 200, "body": json.dumps({"ok": True, "action": "coordination"})}
+        return {"statusCode": 200, "body": _BODY_COORDINATION}
 
     # -------------------------
     # Single-participant flow
     # -------------------------
 
     thread_state, decision = process_incoming_email(
-        table=_table(),
+        table=table,
         thread_id=thread_id,
         message_id=message_id,
         body_text=body_text,
@@ -385,7 +446,7 @@ def handle_ses_event(event: dict) -> dict:
     )
 
     if decision.action == "ignore":
-        return {"statusCode": 200, "body": json.dumps({"ok": True, "skipped": True})}
+        return {"statusCode": 200, "body": _BODY_SKIPPED}
 
     # ---- Clarification path: email question only, no ICS ----
     if decision.action == "clarify":
@@ -427,22 +488,23 @@ def handle_ses_event(event: dict) -> dict:
             "thread_id": thread_id,
             "subject": subject,
             "from_email": from_email,
-            "to_emails": list(to_emails),
-            "cc_emails": list(cc_emails),
+            "to_emails": to_emails,
+            "cc_emails": cc_emails,
             "s3_key": used_key,
-            "received_at": datetime.utcnow().isoformat() + "Z",
-            "clarification_sent_at": datetime.utcnow().isoformat() + "Z",
+            "received_at": now_iso,
+            "clarification_sent_at": now_iso,
             "ai_raw": ai_result.get("raw") if isinstance(ai_result, dict) else None,
             "conv_state": thread_state.state,
             "conv_intent": thread_state.intent,
             "conv_question": decision.reply_text,
         })
-        _table().put_item(Item=ddb_clean(ddb_sanitize(item)))
+        table.put_item(Item=ddb_clean(ddb_sanitize(item)))
+        _remember_handled(message_id)
 
-        return {"statusCode": 200, "body": json.dumps({"ok": True, "action": "clarify"})}
+        return {"statusCode": 200, "body": _BODY_CLARIFY}
 
     # ---- Scheduling path ----
-    tz = ZoneInfo(thread_state.timezone or TIMEZONE)
+    tz = get_zoneinfo(thread_state.timezone or TIMEZONE)
     start, end = next_day_at_default_time(tz)
 
     if decision.time_kind == "candidate" and decision.chosen_candidate:
@@ -452,8 +514,8 @@ def handle_ses_event(event: dict) -> dict:
         except Exception as e:
             print("[decision] candidate parse failed; falling back:", repr(e))
 
-    event_uid = f"{uuid.uuid4()}@{IRIS_EMAIL.split('@', 1)[1]}"
-    attendees = dedupe([from_email] + to_emails)
+    event_uid = f"{uuid.uuid4()}@{_IRIS_DOMAIN}"
+    attendees = dedupe(chain([from_email], to_emails))
 
     meet_url = None
     try:
@@ -470,13 +532,10 @@ def handle_ses_event(event: dict) -> dict:
     except Exception as e:
         print("[meet] create failed", repr(e))
 
-    description = None
-    location = None
-    url = None
+    description = location = url = None
     if meet_url:
-        description = _append_line(description, f"Google Meet: {meet_url}")
-        location = _append_line(location, meet_url)
-        url = _append_line(url, meet_url)
+        description = f"Google Meet: {meet_url}"
+        location = url = meet_url
 
     ics = build_ics(
         subject=subject,
@@ -516,7 +575,7 @@ def handle_ses_event(event: dict) -> dict:
     )
 
     # Close any pending reminder loop once scheduled.
-    store = CoordinationStore(_table())
+    store = CoordinationStore(table)
     thread = store.get(thread_id)
     if thread:
         thread.reminder_status = "SCHEDULED"
@@ -528,29 +587,32 @@ def handle_ses_event(event: dict) -> dict:
         "thread_id": thread_id,
         "subject": subject,
         "from_email": from_email,
-        "to_emails": list(to_emails),
-        "cc_emails": list(cc_emails),
+        "to_emails": to_emails,
+        "cc_emails": cc_emails,
         "s3_key": used_key,
-        "received_at": datetime.utcnow().isoformat() + "Z",
+        "received_at": now_iso,
         "event_uid": event_uid,
-        "invite_sent_at": datetime.utcnow().isoformat() + "Z",
+        "invite_sent_at": now_iso,
         "ai_raw": ai_result.get("raw") if isinstance(ai_result, dict) else None,
         "conv_state": thread_state.state,
         "conv_intent": thread_state.intent,
         "scheduled_start": start.isoformat(),
         "scheduled_end": end.isoformat(),
     })
-    _table().put_item(Item=ddb_clean(ddb_sanitize(item)))
+    table.put_item(Item=ddb_clean(ddb_sanitize(item)))
+    _remember_handled(message_id)
 
-    return {"statusCode": 200, "body": json.dumps({"ok": True, "action": "scheduled"})}
+    return {"statusCode": 200, "body": _BODY_SCHEDULED}
 
 
 def lambda_handler(event, context):
     try:
         return handle_ses_event(event)
-    except ClientError as e:
-        print("[error] ClientError", repr(e))
-        return {"statusCode": 500, "body": json.dumps({"error": str(e)})}
     except Exception as e:
-        print("[error]", repr(e))
-        return {"statusCode": 500, "body": json.dumps({"error": str(e)})}
+        # botocore is only needed to label the failure; keep it off the module import path.
+        from botocore.exceptions import ClientError
+        if isinstance(e, ClientError):
+            print("[error] ClientError", repr(e))
+        else:
+            print("[error]", repr(e))
+        return {"statusCode": 500, "body": json_dumps_compact({"error": str(e)})}
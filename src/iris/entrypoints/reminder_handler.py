@@ -112,7 +112,7 @@ def lambda_handler(event, context):
             )
             continue
 
-        subject = f"{thread.subject} — availability reminder"
+        subject = thread.subjects.reminder
         body = reminder_email()
         raw_mime = build_raw_mime_text_reply(
             subject=subject,
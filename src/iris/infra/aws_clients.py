@@ -1,53 +1,73 @@
 from __future__ import annotations
 
-import boto3
 from typing import Optional
 
 from .config import AWS_REGION, TABLE_NAME
 
+# Clients are created on first use; boto3 itself is imported there too so that
+# importing this module (and everything that depends on it) doesn't load the SDK.
 _s3 = None
 _ses = None
 _ddb = None
 _ddb_client = None
 _scheduler = None
+_table = None
+_config = None
+
+
+def _client_config():
+    # TCP keepalive keeps pooled connections usable across warm invocations.
+    global _config
+    if _config is None:
+        from botocore.config import Config
+        _config = Config(tcp_keepalive=True)
+    return _config
 
 
 def s3():
     global _s3
     if _s3 is None:
-        _s3 = boto3.client("s3", region_name=AWS_REGION)
+        import boto3
+        _s3 = boto3.client("s3", region_name=AWS_REGION, config=_client_config())
     return _s3
 
 
 def ses():
     global _ses
     if _ses is None:
-        _ses = boto3.client("ses", region_name=AWS_REGION)
+        import boto3
+        _ses = boto3.client("ses", region_name=AWS_REGION, config=_client_config())
     return _ses
 
 
 def ddb():
     global _ddb
     if _ddb is None:
-        _ddb = boto3.resource("dynamodb", region_name=AWS_REGION)
+        import boto3
+        _ddb = boto3.resource("dynamodb", region_name=AWS_REGION, config=_client_config())
     return _ddb
 
 
 def ddb_client():
     global _ddb_client
     if _ddb_client is None:
-        _ddb_client = boto3.client("dynamodb", region_name=AWS_REGION)
+        import boto3
+        _ddb_client = boto3.client("dynamodb", region_name=AWS_REGION, config=_client_config())
     return _ddb_client
 
 
 def scheduler():
     global _scheduler
     if _scheduler is None:
-        _scheduler = boto3.client("scheduler", region_name=AWS_REGION)
+        import boto3
+        _scheduler = boto3.client("scheduler", region_name=AWS_REGION, config=_client_config())
     return _scheduler
 
 
 def table():
-    if not TABLE_NAME:
-        raise RuntimeError("TABLE_NAME is not set")
-    return ddb().Table(TABLE_NAME)
+    global _table
+    if _table is None:
+        if not TABLE_NAME:
+            raise RuntimeError("TABLE_NAME is not set")
+        _table = ddb().Table(TABLE_NAME)
+    return _table
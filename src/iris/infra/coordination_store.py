@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
+import zlib
 from datetime import datetime, date
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from ..coordination.models import MeetingThread, Participant, TimeWindow, ThreadStatus
 from ..infra.ddb import key_for_message
-from ..infra.serialization import ddb_clean, ddb_sanitize, to_json_safe
+from ..infra.serialization import ddb_clean, ddb_sanitize, to_json_safe, json_dumps_compact, json_loads
 
 
 def _coord_key(thread_id: str) -> dict:
@@ -33,11 +33,54 @@ def _parse_date(value: Optional[str]) -> Optional[date]:
         return None
 
 
+_PARTICIPANT_DT_FIELDS = ("responded_at", "requested_at", "last_reminded_at")
+_THREAD_DT_FIELDS = ("availability_requests_sent_at", "deadline_at", "scheduled_start", "scheduled_end")
+
+
+# Serialized state at or above this size is stored zlib-compressed as a Binary attribute
+# (DynamoDB bills writes per started KB); smaller threads stay readable JSON.
+_COMPRESS_MIN_BYTES = 1024
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _participant_to_dict(p: Participant) -> dict:
+    # Windows are inlined rather than going through a per-window helper call.
+    return {
+        "email": p.email,
+        "has_responded": p.has_responded,
+        "raw_response_text": p.raw_response_text,
+        "parsed_windows": [
+            {"day": w.day.isoformat(), "start_minute": w.start_minute, "end_minute": w.end_minute}
+            for w in (p.parsed_windows or ())
+        ],
+        "needs_clarification": p.needs_clarification,
+        "clarification_question": p.clarification_question,
+        "responded_at": _iso(p.responded_at),
+        "status": p.status,
+        "requested_at": _iso(p.requested_at),
+        "last_reminded_at": _iso(p.last_reminded_at),
+    }
+
+
 class CoordinationStore:
+    """
+    Coordination thread state stored as one JSON attribute per thread.
+
+    Instances are created per invocation, so decoded threads are kept in memory: a second
+    get() for the same thread (e.g. the entrypoint's lookup, then the coordination handler's)
+    returns the already-decoded object instead of reading and parsing the item again.
+    """
     def __init__(self, table):
         self._table = table
+        self._cache: Dict[str, MeetingThread] = {}
 
     def get(self, thread_id: str) -> Optional[MeetingThread]:
+        cached = self._cache.get(thread_id)
+        if cached is not None:
+            return cached
         resp = self._table.get_item(Key=_coord_key(thread_id))
         item = resp.get("Item")
         if not item:
@@ -45,7 +88,14 @@ class CoordinationStore:
         if item.get("record_type") != "COORDINATION_THREAD":
             return None
 
-        data = json.loads(item.get("coordination_json") or "{}")
+        blob = item.get("coordination_zlib")
+        if blob is not None:
+            # boto3 returns Binary attributes wrapped; .value is the raw bytes.
+            data = json_loads(zlib.decompress(getattr(blob, "value", blob)))
+        else:
+            data = json_loads(item.get("coordination_json") or "{}")
+        # Participants' windows mostly share a handful of days; parse each day string once.
+        days: Dict[str, Optional[date]] = {}
         participants = {}
         for email, pd in (data.get("participants") or {}).items():
             email_norm = (email or "").lower()
@@ -54,16 +104,18 @@ class CoordinationStore:
             p.raw_response_text = pd.get("raw_response_text")
             p.needs_clarification = bool(pd.get("needs_clarification"))
             p.clarification_question = pd.get("clarification_question")
-            p.responded_at = _parse_iso(pd.get("responded_at"))
+            for k in _PARTICIPANT_DT_FIELDS:
+                setattr(p, k, _parse_iso(pd.get(k)))
             p.status = pd.get("status") or ("RESPONDED" if p.has_responded else "PENDING")
-            p.requested_at = _parse_iso(pd.get("requested_at"))
-            p.last_reminded_at = _parse_iso(pd.get("last_reminded_at"))
 
             p.parsed_windows = []
             for w in (pd.get("parsed_windows") or []):
-                parsed_day = _parse_date(w.get("day"))
+                day_str = w.get("day")
+                parsed_day = days.get(day_str)
                 if parsed_day is None:
-                    continue
+                    parsed_day = days[day_str] = _parse_date(day_str)
+                    if parsed_day is None:
+                        continue
                 try:
                     p.parsed_windows.append(TimeWindow(
                         day=parsed_day,
@@ -92,64 +144,64 @@ class CoordinationStore:
         if created_at:
             thread.created_at = created_at
 
-        thread.availability_requests_sent_at = _parse_iso(data.get("availability_requests_sent_at"))
-        thread.deadline_at = _parse_iso(data.get("deadline_at"))
-        thread.scheduled_start = _parse_iso(data.get("scheduled_start"))
-        thread.scheduled_end = _parse_iso(data.get("scheduled_end"))
+        for k in _THREAD_DT_FIELDS:
+            setattr(thread, k, _parse_iso(data.get(k)))
         thread.scheduling_rationale = data.get("scheduling_rationale")
         thread.pending_candidate = data.get("pending_candidate")
         thread.reminder_status = data.get("reminder_status") or thread.reminder_status
         thread.reminder_schedule_name = data.get("reminder_schedule_name")
 
+        self._cache[thread_id] = thread
         return thread
 
     def put(self, thread: MeetingThread) -> None:
-        def tw_to_dict(tw: TimeWindow) -> dict:
-            return {
-                "day": tw.day.isoformat(),
-                "start_minute": tw.start_minute,
-                "end_minute": tw.end_minute,
-            }
-
-        def participant_to_dict(p: Participant) -> dict:
-            return {
-                "email": p.email,
-                "has_responded": p.has_responded,
-                "raw_response_text": p.raw_response_text,
-                "parsed_windows": [tw_to_dict(w) for w in (p.parsed_windows or [])],
-                "needs_clarification": p.needs_clarification,
-                "clarification_question": p.clarification_question,
-                "responded_at": p.responded_at.isoformat() if p.responded_at else None,
-                "status": p.status,
-                "requested_at": p.requested_at.isoformat() if p.requested_at else None,
-                "last_reminded_at": p.last_reminded_at.isoformat() if p.last_reminded_at else None,
-            }
-
+        self._table.put_item(Item=self._to_item(thread))
+        self._cache[thread.thread_id] = thread
+
+    def batch_put(self, threads: Iterable[MeetingThread], extra_items: Iterable[dict] = ()) -> None:
+        """
+        Write threads (plus any ready-made items, e.g. the MESSAGE record) through one
+        batch_writer, so up to 25 items cost a single BatchWriteItem round-trip.
+        """
+        with self._table.batch_writer() as batch:
+            for thread in threads:
+                batch.put_item(Item=self._to_item(thread))
+                self._cache[thread.thread_id] = thread
+            for item in extra_items:
+                batch.put_item(Item=item)
+
+    def _to_item(self, thread: MeetingThread) -> dict:
         data = {
             "thread_id": thread.thread_id,
             "organizer_email": thread.organizer_email,
-            "participants": {e: participant_to_dict(p) for e, p in (thread.participants or {}).items()},
+            "participants": {e: _participant_to_dict(p) for e, p in (thread.participants or {}).items()},
             "timezone": thread.timezone,
             "meeting_duration_minutes": thread.meeting_duration_minutes,
             "subject": thread.subject,
             "status": thread.status.value if isinstance(thread.status, ThreadStatus) else thread.status,
-            "availability_requests_sent_at": thread.availability_requests_sent_at.isoformat()
-                if thread.availability_requests_sent_at else None,
-            "deadline_at": thread.deadline_at.isoformat() if thread.deadline_at else None,
-            "scheduled_start": thread.scheduled_start.isoformat() if thread.scheduled_start else None,
-            "scheduled_end": thread.scheduled_end.isoformat() if thread.scheduled_end else None,
+            "availability_requests_sent_at": _iso(thread.availability_requests_sent_at),
+            "deadline_at": _iso(thread.deadline_at),
+            "scheduled_start": _iso(thread.scheduled_start),
+            "scheduled_end": _iso(thread.scheduled_end),
             "scheduling_rationale": thread.scheduling_rationale,
             "pending_candidate": thread.pending_candidate,
-            "created_at": thread.created_at.isoformat() if thread.created_at else None,
+            "created_at": _iso(thread.created_at),
             "reminder_status": thread.reminder_status,
             "reminder_schedule_name": thread.reminder_schedule_name,
         }
 
+        # Compact and sparse: get() defaults every field, so None/empty values needn't be stored.
+        payload = json_dumps_compact(ddb_clean(to_json_safe(data)))
+
         item = _coord_key(thread.thread_id)
         item.update({
             "record_type": "COORDINATION_THREAD",
             "thread_id": thread.thread_id,
             "updated_at": datetime.utcnow().isoformat() + "Z",
-            "coordination_json": json.dumps(to_json_safe(data)),
         })
-        self._table.put_item(Item=ddb_clean(ddb_sanitize(item)))
+        encoded = payload.encode("utf-8")
+        if len(encoded) >= _COMPRESS_MIN_BYTES:
+            item["coordination_zlib"] = zlib.compress(encoded)
+        else:
+            item["coordination_json"] = payload
+        return ddb_clean(ddb_sanitize(item))
@@ -3,18 +3,32 @@ import os
 import uuid
 import urllib.parse
 
-import boto3
-import urllib3
-
-http = urllib3.PoolManager()
-secrets = boto3.client("secretsmanager")
+# Created on first use so importing this module doesn't load boto3/urllib3 or open clients.
+_http = None
+_secrets = None
 
 TOKEN_URL = "https://oauth2.googleapis.com/token"
 CAL_EVENTS_URL = "https://www.googleapis.com/calendar/v3/calendars/primary/events"
 
 
+def http():
+    global _http
+    if _http is None:
+        import urllib3
+        _http = urllib3.PoolManager()
+    return _http
+
+
+def secrets():
+    global _secrets
+    if _secrets is None:
+        import boto3
+        _secrets = boto3.client("secretsmanager")
+    return _secrets
+
+
 def _get_oauth_secret(secret_name: str) -> dict:
-    resp = secrets.get_secret_value(SecretId=secret_name)
+    resp = secrets().get_secret_value(SecretId=secret_name)
     return json.loads(resp["SecretString"])
 
 
@@ -28,7 +42,7 @@ def _refresh_access_token(client_id: str, client_secret: str, refresh_token: str
         }
     ).encode("utf-8")
 
-    resp = http.request(
+    resp = http().request(
         "POST",
         TOKEN_URL,
         body=body,
@@ -74,7 +88,7 @@ def create_meet_event(
     }
 
     url = f"{CAL_EVENTS_URL}?conferenceDataVersion=1"
-    resp = http.request(
+    resp = http().request(
         "POST",
         url,
         body=json.dumps(payload).encode("utf-8"),
@@ -6,8 +6,6 @@ import re
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from botocore.exceptions import ClientError
-
 from .aws_clients import scheduler as _scheduler
 from .config import (
     REMINDER_LAMBDA_ARN,
@@ -39,6 +37,8 @@ def ensure_reminder_schedule(thread_id: str) -> Optional[str]:
         print("[reminder] missing REMINDER_LAMBDA_ARN or SCHEDULER_ROLE_ARN")
         return None
 
+    from botocore.exceptions import ClientError
+
     name = reminder_schedule_name(thread_id)
     group = SCHEDULER_GROUP_NAME or "default"
     client = _scheduler()
@@ -1,10 +1,53 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, Optional, List
 
 from .aws_clients import s3 as _s3
 from ..email.email_utils import dedupe
 
+# Emails up to this size come back from the first GET; larger ones (attachments) are
+# fetched as parallel ranged GETs of this size.
+_CHUNK_BYTES = 4 * 1024 * 1024
+_RANGE_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+def _error_code(e: Exception) -> Optional[str]:
+    return getattr(e, "response", {}).get("Error", {}).get("Code")
+
+
+def _get_range(bucket: str, key: str, start: int, end: int, etag: Optional[str]) -> bytes:
+    kwargs = {"IfMatch": etag} if etag else {}
+    return _s3().get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end}", **kwargs)["Body"].read()
+
+
+def _get_object_bytes(bucket: str, key: str) -> bytes:
+    try:
+        resp = _s3().get_object(Bucket=bucket, Key=key, Range=f"bytes=0-{_CHUNK_BYTES - 1}")
+    except Exception as e:
+        # A ranged GET of an empty object is rejected rather than returning nothing.
+        if _error_code(e) == "InvalidRange":
+            return b""
+        raise
+    first = resp["Body"].read()
+    # ContentRange looks like "bytes 0-4194303/10485760"; the part after "/" is the full size.
+    total = int((resp.get("ContentRange") or "").rpartition("/")[2] or len(first))
+    if total <= len(first):
+        return first
+    ranges = [(start, min(start + _CHUNK_BYTES, total) - 1) for start in range(len(first), total, _CHUNK_BYTES)]
+    # Pin the remaining ranges to the first response's version so an overwrite in between
+    # can't splice two objects together; if it did change, read the new one in full.
+    etag = resp.get("ETag")
+    try:
+        rest = list(_RANGE_POOL.map(lambda r: _get_range(bucket, key, *r, etag), ranges))
+    except Exception as e:
+        if _error_code(e) != "PreconditionFailed":
+            raise
+        print(f"[s3] object changed during ranged read key={key}; refetching in full")
+        return _s3().get_object(Bucket=bucket, Key=key)["Body"].read()
+    return b"".join([first, *rest])
+
+
 def load_email_bytes_from_s3(bucket: str, message_id: str, receipt: dict) -> Tuple[bytes, str]:
     candidate_keys: List[str] = []
 
@@ -22,8 +65,7 @@ def load_email_bytes_from_s3(bucket: str, message_id: str, receipt: dict) -> Tup
     for k in dedupe(candidate_keys):
         try:
             print(f"[s3] trying key={k}")
-            resp = _s3().get_object(Bucket=bucket, Key=k)
-            data = resp["Body"].read()
+            data = _get_object_bytes(bucket, k)
             print(f"[s3] loaded key={k} bytes={len(data)}")
             return data, k
         except Exception as e:
@@ -1,19 +1,55 @@
 from __future__ import annotations
 
+import json
 from decimal import Decimal
 from typing import Any
 
 
 def to_ddb_safe(x: Any) -> Any:
-    """Convert floats to Decimal recursively for DynamoDB compatibility."""
+    """
+    Convert floats to Decimal recursively for DynamoDB compatibility.
+    Copy-on-write: containers with no float (or tuple) inside are returned as-is,
+    so only the path down to each converted value is re-allocated. The result may
+    therefore be (or share nested containers with) the input: treat both as read-only,
+    or copy before mutating either.
+    """
     if isinstance(x, float):
         return Decimal(str(x))
     if isinstance(x, dict):
-        return {k: to_ddb_safe(v) for k, v in x.items()}
+        out = None
+        for k, v in x.items():
+            if v is None or isinstance(v, (str, bool, int)):
+                continue
+            nv = to_ddb_safe(v)
+            if nv is not v:
+                if out is None:
+                    out = dict(x)
+                out[k] = nv
+        return x if out is None else out
+    if isinstance(x, (list, tuple)):
+        out = None
+        for i, v in enumerate(x):
+            if v is None or isinstance(v, (str, bool, int)):
+                continue
+            nv = to_ddb_safe(v)
+            if nv is not v:
+                if out is None:
+                    out = list(x)
+                out[i] = nv
+        if out is not None:
+            return out
+        return list(x) if isinstance(x, tuple) else x
+    return x
+
+
+def from_ddb_safe(x: Any) -> Any:
+    """Convert DynamoDB Decimals back to int (integral values) or float, recursively."""
+    if isinstance(x, Decimal):
+        return int(x) if x == x.to_integral_value() else float(x)
+    if isinstance(x, dict):
+        return {k: from_ddb_safe(v) for k, v in x.items()}
     if isinstance(x, list):
-        return [to_ddb_safe(v) for v in x]
-    if isinstance(x, tuple):
-        return [to_ddb_safe(v) for v in x]
+        return [from_ddb_safe(v) for v in x]
     return x
 
 
@@ -55,3 +91,13 @@ def ddb_clean(item: Any) -> Any:
 def ddb_sanitize(item: Any) -> Any:
     """Backwards-compatible alias for DynamoDB sanitization."""
     return to_ddb_safe(item)
+
+
+def json_dumps_compact(x: Any) -> str:
+    """Serialize JSON-safe data to a compact string."""
+    return json.dumps(x, separators=(",", ":"))
+
+
+def json_loads(s: str | bytes) -> Any:
+    """Parse a JSON document."""
+    return json.loads(s)
@@ -7,6 +7,8 @@ from . import ddb as ddb_mod
 from .config import DDB_SK_VALUE
 from .serialization import ddb_clean, ddb_sanitize
 
+_MSGID_RE = re.compile(r"<([^>]+)>")
+
 
 def _normalize_message_id(value: str) -> str:
     return value.replace("\n", "").replace("\r", "").strip().strip("<>").strip()
@@ -37,7 +39,7 @@ def extract_message_ids(eml: dict) -> List[str]:
         _add(str(irt))
 
     refs = str(eml.get("References") or "")
-    for m in re.findall(r"<([^>]+)>", refs):
+    for m in _MSGID_RE.findall(refs):
         _add(m)
 
     return ids
@@ -80,14 +82,19 @@ def resolve_thread_id(eml: dict, ses_message_id: str, table) -> str:
 def upsert_thread_aliases(table, candidates: List[str], thread_id: str) -> None:
     """
     Store alias records for all candidate message IDs.
+    All aliases go through one batch_writer, so a reply with several Message-Id
+    candidates costs a single BatchWriteItem instead of one PutItem per alias.
     """
-    for mid in candidates:
-        item = _alias_key(mid)
-        item.update(
-            {
-                "record_type": "THREAD_ALIAS",
-                "alias": mid,
-                "thread_id": thread_id,
-            }
-        )
-        table.put_item(Item=ddb_clean(ddb_sanitize(item)))
+    ddb_mod.ensure_schema_loaded()
+    key_attrs = [a for a in (ddb_mod.PK_ATTR, ddb_mod.SK_ATTR) if a]
+    with table.batch_writer(overwrite_by_pkeys=key_attrs) as batch:
+        for mid in candidates:
+            item = _alias_key(mid)
+            item.update(
+                {
+                    "record_type": "THREAD_ALIAS",
+                    "alias": mid,
+                    "thread_id": thread_id,
+                }
+            )
+            batch.put_item(Item=ddb_clean(ddb_sanitize(item)))
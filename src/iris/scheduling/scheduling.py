@@ -9,21 +9,17 @@ from ..infra.config import DEFAULT_START_HOUR, DEFAULT_DURATION_MINUTES
 
 def next_day_at_default_time(local_tz: ZoneInfo):
     now_local = datetime.now(tz=local_tz)
-    next_day = (now_local + timedelta(days=1)).date()
-    start = datetime(
-        next_day.year,
-        next_day.month,
-        next_day.day,
-        DEFAULT_START_HOUR,
-        0,
-        0,
-        tzinfo=local_tz,
-    )
+    start = (now_local + timedelta(days=1)).replace(hour=DEFAULT_START_HOUR, minute=0, second=0, microsecond=0)
     end = start + timedelta(minutes=DEFAULT_DURATION_MINUTES)
     return start, end
 
 
 _DOW = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
+# Every spelling the weekday regex below can capture, mapped straight to its index.
+_DOW_BY_TOKEN = {
+    **_DOW,
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3, "friday": 4, "saturday": 5, "sunday": 6,
+}
 
 
 def _next_weekday_date(today_local: datetime, target_wd: int) -> datetime:
@@ -69,15 +65,7 @@ def candidate_to_datetimes(candidate: Dict, tz: ZoneInfo) -> Tuple[datetime, dat
     if not mday:
         raise ValueError(f"No weekday found in start_local: {start_local}")
 
-    wd = mday.group(1).lower()
-    if wd.startswith("tue"):
-        wd_key = "tue"
-    elif wd.startswith("thu"):
-        wd_key = "thu"
-    else:
-        wd_key = wd[:3]
-
-    target_wd = _DOW[wd_key]
+    target_wd = _DOW_BY_TOKEN[mday.group(1).lower()]
 
     now_local = datetime.now(tz=tz)
     base = _next_weekday_date(now_local, target_wd)
@@ -85,8 +73,9 @@ def candidate_to_datetimes(candidate: Dict, tz: ZoneInfo) -> Tuple[datetime, dat
     sh, sm = _parse_time_12h(start_local)
     eh, em = _parse_time_12h(end_local)
 
-    start_dt = datetime(base.year, base.month, base.day, sh, sm, tzinfo=tz)
-    end_dt = datetime(base.year, base.month, base.day, eh, em, tzinfo=tz)
+    # base already carries tz from now_local; only the clock fields change.
+    start_dt = base.replace(hour=sh, minute=sm, second=0, microsecond=0)
+    end_dt = base.replace(hour=eh, minute=em, second=0, microsecond=0)
 
     if start_dt <= now_local and base.date() == now_local.date():
         start_dt = start_dt + timedelta(days=7)
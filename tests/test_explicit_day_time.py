@@ -0,0 +1,46 @@
+import unittest
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from iris.coordination.handler import _parse_explicit_day_time
+
+TZ = "America/New_York"
+# Wednesday 2026-10-14, 10:00 local.
+NOW = datetime(2026, 10, 14, 10, 0, tzinfo=ZoneInfo(TZ))
+
+
+def _parse(text):
+    dt = _parse_explicit_day_time(text, TZ, now_local=NOW)
+    return dt and (dt.strftime("%a"), dt.hour, dt.minute, dt.date().isoformat())
+
+
+class ExplicitDayTimeTest(unittest.TestCase):
+    def test_day_followed_by_time(self):
+        self.assertEqual(_parse("tue at 3pm"), ("Tue", 15, 0, "2026-10-20"))
+        self.assertEqual(_parse("Let's do FRI 9:15 AM"), ("Fri", 9, 15, "2026-10-16"))
+
+    def test_time_after_the_day_wins_over_an_earlier_time(self):
+        self.assertEqual(_parse("10:30am next week thu 12pm"), ("Thu", 12, 0, "2026-10-15"))
+        self.assertEqual(_parse("7PM 1h 11 AM Tuesday 12am"), ("Tue", 0, 0, "2026-10-20"))
+
+    def test_day_without_a_nearby_time_is_passed_over(self):
+        text = "thurs is out, I'm travelling all day long sadly. mon 12pm works"
+        self.assertEqual(_parse(text), ("Mon", 12, 0, "2026-10-19"))
+
+    def test_unpaired_day_and_time_use_the_first_of_each(self):
+        self.assertEqual(_parse("3pm on friday"), ("Fri", 15, 0, "2026-10-16"))
+        self.assertEqual(_parse("Thursday\n\nany time after 3pm"), ("Thu", 15, 0, "2026-10-15"))
+
+    def test_past_time_today_rolls_to_next_week(self):
+        self.assertEqual(_parse("wed 9am"), ("Wed", 9, 0, "2026-10-21"))
+        self.assertEqual(_parse("wed 11am"), ("Wed", 11, 0, "2026-10-14"))
+
+    def test_missing_day_or_meridiem(self):
+        self.assertIsNone(_parse("3pm works for me"))
+        self.assertIsNone(_parse("friday at noon"))
+        self.assertIsNone(_parse("friday at 15:00"))
+        self.assertIsNone(_parse(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+import copy
+import json
+import re
+import unittest
+
+from iris.coordination.models import MeetingThread, Participant
+from iris.coordination.store_ddb import DdbThreadStore
+
+
+class _ClientError(Exception):
+    def __init__(self, code: str):
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class FakeTable:
+    """
+    In-memory stand-in for a boto3 Table: get_item, put_item, batch_writer and the subset of
+    UpdateItem that DdbThreadStore emits (SET/REMOVE on #alias paths, attribute_(not_)exists
+    conditions). Like DynamoDB, an UpdateItem on a missing key creates the item.
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.calls = []
+
+    def _k(self, key):
+        return key["pk"], key["sk"]
+
+    def get_item(self, Key):
+        item = self.items.get(self._k(Key))
+        return {"Item": copy.deepcopy(item)} if item else {}
+
+    def put_item(self, Item):
+        self.calls.append("put_item")
+        self.items[self._k(Item)] = copy.deepcopy(Item)
+
+    def batch_writer(self, **_):
+        table = self
+
+        class _Batch:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def put_item(self, Item):
+                table.put_item(Item=Item)
+
+        return _Batch()
+
+    def update_item(self, Key, UpdateExpression, ConditionExpression,
+                    ExpressionAttributeNames, ExpressionAttributeValues):
+        names, values = ExpressionAttributeNames, ExpressionAttributeValues
+        item = copy.deepcopy(self.items.get(self._k(Key)) or dict(Key))
+
+        def parts(path):
+            return [names[p] for p in path.split(".")]
+
+        def exists(path):
+            cur = item
+            for p in parts(path):
+                if not isinstance(cur, dict) or p not in cur:
+                    return False
+                cur = cur[p]
+            return True
+
+        for fn, path in re.findall(r"(attribute_\w+)\(([^)]*)\)", ConditionExpression):
+            if (fn == "attribute_exists") != exists(path):
+                raise _ClientError("ConditionalCheckFailedException")
+
+        m = re.fullmatch(r"SET (.*?)(?: REMOVE (.*))?", UpdateExpression)
+        for assignment in m.group(1).split(", "):
+            path, placeholder = assignment.split(" = ")
+            *parents, leaf = parts(path)
+            cur = item
+            for p in parents:
+                if p not in cur:
+                    raise _ClientError("ValidationException")
+                cur = cur[p]
+            cur[leaf] = copy.deepcopy(values[placeholder])
+        for path in (m.group(2) or "").split(", ") if m.group(2) else []:
+            *parents, leaf = parts(path)
+            cur = item
+            for p in parents:
+                cur = cur.get(p, {})
+            cur.pop(leaf, None)
+
+        self.calls.append("update_item")
+        self.items[self._k(Key)] = item
+
+
+def _thread(thread_id, emails):
+    return MeetingThread(
+        thread_id=thread_id,
+        organizer_email="org@example.com",
+        participants={e: Participant(email=e) for e in emails},
+        timezone="America/New_York",
+    )
+
+
+class DdbThreadStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.table = FakeTable()
+        self.store = DdbThreadStore(self.table)
+
+    def _item(self, thread_id):
+        return self.table.items.get((thread_id, "COORDINATION"))
+
+    def _put_legacy(self, thread_id):
+        data = {
+            "thread_id": thread_id,
+            "organizer_email": "org@example.com",
+            "timezone": "America/New_York",
+            "participants": {"a@example.com": {"has_responded": False}},
+        }
+        self.table.items[(thread_id, "COORDINATION")] = {
+            "pk": thread_id, "sk": "COORDINATION", "json": json.dumps(data),
+        }
+
+    def test_new_thread_is_put_in_full(self):
+        self.store.put(_thread("t1", ["a@example.com"]))
+        self.assertEqual(self.table.calls, ["put_item"])
+        self.assertIn("a@example.com", self._item("t1")["participants"])
+
+    def test_legacy_json_item_is_rewritten_natively(self):
+        self._put_legacy("t1")
+        thread = self.store.get("t1")
+        thread.participants["a@example.com"].status = "RESPONDED"
+        self.store.put(thread)
+
+        self.assertEqual(self.table.calls, ["put_item"])
+        self.assertNotIn("json", self._item("t1"))
+        self.assertEqual(self.store.get("t1").participants["a@example.com"].status, "RESPONDED")
+
+    def test_legacy_update_fields_falls_back_to_full_put(self):
+        self._put_legacy("t1")
+        self.store.update_fields("t1", subject="Sync")
+
+        self.assertNotIn("json", self._item("t1"))
+        self.assertEqual(self.store.get("t1").subject, "Sync")
+
+    def test_legacy_update_participant_falls_back_to_full_put(self):
+        self._put_legacy("t1")
+        self.store.update_participant("t1", "a@example.com", status="RESPONDED")
+
+        self.assertNotIn("json", self._item("t1"))
+        self.assertEqual(self.store.get("t1").participants["a@example.com"].status, "RESPONDED")
+
+    def test_updates_on_a_missing_item_write_nothing(self):
+        self.store.update_fields("missing", status="SCHEDULED")
+        self.store.update_participant("missing", "a@example.com", status="RESPONDED")
+
+        self.assertIsNone(self._item("missing"))
+        self.assertIsNone(self.store.get("missing"))
+
+    def test_loaded_thread_patches_added_changed_and_removed_participants(self):
+        self.store.put(_thread("t1", ["a@example.com", "b@example.com", "c@example.com"]))
+        thread = self.store.get("t1")
+        thread.participants["a@example.com"].status = "RESPONDED"
+        del thread.participants["b@example.com"]
+        thread.participants["d@example.com"] = Participant(email="d@example.com")
+        self.table.calls.clear()
+        self.store.put(thread)
+
+        self.assertEqual(self.table.calls, ["update_item"])
+        stored = self.store.get("t1").participants
+        self.assertEqual(sorted(stored), ["a@example.com", "c@example.com", "d@example.com"])
+        self.assertEqual(stored["a@example.com"].status, "RESPONDED")
+        self.assertEqual(stored["c@example.com"].status, "PENDING")
+
+    def test_emptying_participants_removes_the_map(self):
+        self.store.put(_thread("t1", ["a@example.com"]))
+        thread = self.store.get("t1")
+        thread.participants.clear()
+        self.table.calls.clear()
+        self.store.put(thread)
+
+        self.assertEqual(self.table.calls, ["update_item"])
+        self.assertNotIn("participants", self._item("t1"))
+        self.assertEqual(self.store.get("t1").participants, {})
+
+    def test_first_participant_on_a_thread_without_a_map(self):
+        self.store.put(_thread("t1", []))
+        self.assertNotIn("participants", self._item("t1"))
+
+        thread = self.store.get("t1")
+        thread.participants["a@example.com"] = Participant(email="a@example.com")
+        self.table.calls.clear()
+        self.store.put(thread)
+
+        self.assertEqual(self.table.calls, ["update_item"])
+        self.assertEqual(sorted(self.store.get("t1").participants), ["a@example.com"])
+
+    def test_update_participant_without_a_map_falls_back_to_full_put(self):
+        self.store.put(_thread("t1", []))
+        self.store.update_participant("t1", "a@example.com", status="RESPONDED")
+
+        self.assertEqual(self.store.get("t1").participants["a@example.com"].status, "RESPONDED")
+
+    def test_update_fields_patches_in_place(self):
+        self.store.put(_thread("t1", ["a@example.com"]))
+        self.table.calls.clear()
+        self.store.update_fields("t1", subject="Sync", scheduling_rationale=None)
+
+        self.assertEqual(self.table.calls, ["update_item"])
+        self.assertEqual(self.store.get("t1").subject, "Sync")
+
+
+if __name__ == "__main__":
+    unittest.main()